@@ -9,11 +9,43 @@ and saves them as a baseline for future comparisons.
 Requirements: Phase 1 - Baseline & Guardrails
 """
 
+import argparse
 import json
+import mmap
+import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Only search_memory requests count toward the metrics; lines without this
+# token are skipped before they are decoded
+SEARCH_MEMORY_MARKER = b'"search_memory"'
+
+# mcp_replay summary lines, e.g.
+#   "Macro Precision: 0.886, Macro NDCG: 1.470"
+#   "Cache hit rate:       0.21"
+#   "Pairs scored:         86"
+#   "LLM calls/failures:   67 / 0"
+#   "Prefetch requests:    10 (hits 7, misses 20)"
+SUMMARY_PATTERN = re.compile(
+    r'^[ \t]*(?:'
+    r'Macro Precision:\s*(?P<precision>[\d.]+)(?:,\s*Macro NDCG:\s*(?P<ndcg>[\d.]+))?'
+    r'|Cache hit rate:\s*(?P<cache_hit_rate>[\d.]+)'
+    r'|Pairs scored:\s*(?P<pairs_scored>\d+)'
+    r'|LLM calls/failures:\s*(?P<llm_calls>\d+)\s*/\s*\d+'
+    r'|Prefetch requests:\s*\d+\s*\(hits\s*(?P<prefetch_hits>\d+),\s*misses\s*(?P<prefetch_misses>\d+)\)'
+    r')',
+    re.MULTILINE,
+)
+
 def extract_metrics_from_run(run_file: Path) -> dict:
     """Extract summary metrics from an MCP run JSONL file"""
 
@@ -29,25 +61,33 @@ def extract_metrics_from_run(run_file: Path) -> dict:
         'total_queries': 0
     }
 
-    # Read JSONL file line by line
-    with open(run_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            try:
-                entry = json.loads(line)
+    # Memory-map the run file and walk it line by line as bytes, decoding
+    # only candidate lines (mmap cannot map an empty file)
+    with open(run_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return metrics
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                if SEARCH_MEMORY_MARKER not in line or not line.lstrip().startswith(b'{'):
+                    continue
 
-                # Count queries
-                if 'request' in entry and entry['request'].get('method') == 'search_memory':
-                    metrics['total_queries'] += 1
+                try:
+                    entry = _loads(line)
 
-                    # Check for zero hits
-                    if 'response' in entry:
-                        result = entry['response'].get('result', {})
-                        if result.get('count', 0) == 0:
-                            metrics['zero_hit_queries'] += 1
+                    # Count queries
+                    if 'request' in entry and entry['request'].get('method') == 'search_memory':
+                        metrics['total_queries'] += 1
 
-            except json.JSONDecodeError:
-                # Skip lines that aren't valid JSON (e.g., summary lines)
-                continue
+                        # Check for zero hits
+                        if 'response' in entry:
+                            result = entry['response'].get('result', {})
+                            if result.get('count', 0) == 0:
+                                metrics['zero_hit_queries'] += 1
+
+                except ValueError:
+                    # Skip lines that aren't valid JSON (e.g., summary lines)
+                    continue
 
     return metrics
 
@@ -56,53 +96,35 @@ def parse_summary_output(stdout: str) -> dict:
 
     metrics = {}
 
-    for line in stdout.split('\n'):
-        line = line.strip()
-
-        # Parse "Macro Precision: 0.886, Macro NDCG: 1.470"
-        if line.startswith('Macro Precision:'):
-            parts = line.split(',')
-
-            # Extract precision
-            prec_part = parts[0].split(':')[1].strip()
-            metrics['macro_precision'] = float(prec_part)
-
-            # Extract NDCG
-            if len(parts) > 1:
-                ndcg_part = parts[1].split(':')[1].strip()
-                metrics['macro_ndcg'] = float(ndcg_part)
-
-        # Parse "Cache hit rate:       0.21"
-        elif 'Cache hit rate:' in line:
-            value = line.split(':')[-1].strip()
-            metrics['cache_hit_rate'] = float(value)
+    # Single pass over stdout; each match fills the groups of one summary line
+    for match in SUMMARY_PATTERN.finditer(stdout):
+        groups = match.groupdict()
+
+        if groups['precision'] is not None:
+            metrics['macro_precision'] = float(groups['precision'])
+            if groups['ndcg'] is not None:
+                metrics['macro_ndcg'] = float(groups['ndcg'])
+        elif groups['cache_hit_rate'] is not None:
+            metrics['cache_hit_rate'] = float(groups['cache_hit_rate'])
+        elif groups['pairs_scored'] is not None:
+            metrics['pairs_scored'] = int(groups['pairs_scored'])
+        elif groups['llm_calls'] is not None:
+            metrics['llm_calls'] = int(groups['llm_calls'])
+        elif groups['prefetch_hits'] is not None:
+            metrics['prefetch_hits'] = int(groups['prefetch_hits'])
+            metrics['prefetch_misses'] = int(groups['prefetch_misses'])
 
-        # Parse "Pairs scored:         86"
-        elif 'Pairs scored:' in line:
-            value = line.split(':')[-1].strip()
-            metrics['pairs_scored'] = int(value)
-
-        # Parse "LLM calls/failures:   67 / 0"
-        elif 'LLM calls/failures:' in line:
-            value = line.split(':')[-1].strip().split('/')[0].strip()
-            metrics['llm_calls'] = int(value)
-
-        # Parse "Prefetch requests:    10 (hits 7, misses 20)"
-        elif 'Prefetch requests:' in line:
-            # Extract hits and misses from parentheses
-            paren_content = line.split('(')[1].split(')')[0]
-            parts = paren_content.split(',')
-
-            hits = int(parts[0].split()[1])
-            misses = int(parts[1].split()[1])
+    return metrics
 
-            metrics['prefetch_hits'] = hits
-            metrics['prefetch_misses'] = misses
+# Summary metrics a baseline cannot be created without
+REQUIRED_SUMMARY_METRICS = ('macro_precision', 'macro_ndcg', 'cache_hit_rate', 'llm_calls')
 
-    return metrics
+def create_baseline(output_path: Path, run_file: Path = None, summary_file: Path = None):
+    """Create baseline snapshot from latest run
 
-def create_baseline(output_path: Path, run_file: Path = None):
-    """Create baseline snapshot from latest run"""
+    Summary metrics come from the mcp_replay summary saved next to the run
+    log (mcp_run-*.summary.txt) unless summary_file is given.
+    """
 
     # Find latest run if not specified
     if run_file is None:
@@ -120,17 +142,28 @@ def create_baseline(output_path: Path, run_file: Path = None):
     # Extract metrics from JSONL
     jsonl_metrics = extract_metrics_from_run(run_file)
 
-    # For summary metrics, we need to read the stdout from the latest test run
-    # For now, use hardcoded Phase 3g results (mcp_run-20251113-170221.jsonl)
-    summary_metrics = {
-        'macro_precision': 0.886,
-        'macro_ndcg': 1.470,
-        'cache_hit_rate': 0.21,
-        'pairs_scored': 86,
-        'llm_calls': 67,
-        'prefetch_hits': 7,
-        'prefetch_misses': 20
-    }
+    # Parse summary metrics from the captured mcp_replay stdout
+    if summary_file is None:
+        summary_file = run_file.with_suffix('.summary.txt')
+
+    if not summary_file.exists():
+        print(
+            f"Error: Summary file not found: {summary_file}\n"
+            "Re-run mcp_replay (it saves the summary next to the run log) "
+            "or pass --summary-file",
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+    summary_metrics = parse_summary_output(summary_file.read_text(encoding='utf-8'))
+
+    missing = [key for key in REQUIRED_SUMMARY_METRICS if summary_metrics.get(key) is None]
+    if missing:
+        print(
+            f"Error: Summary file {summary_file} is missing: {', '.join(missing)}",
+            file=sys.stderr
+        )
+        sys.exit(1)
 
     # Merge metrics
     baseline = {
@@ -173,5 +206,23 @@ def create_baseline(output_path: Path, run_file: Path = None):
     print(f"  Cache hit rate >= {baseline['thresholds']['cache_hit_rate_min']:.0%}")
 
 if __name__ == '__main__':
-    baseline_path = Path('reports/precision_baseline.json')
-    create_baseline(baseline_path)
+    parser = argparse.ArgumentParser(description="Create precision baseline snapshot")
+    parser.add_argument(
+        "--run-file",
+        type=Path,
+        help="MCP run JSONL (default: latest reports/mcp_runs/mcp_run-*.jsonl)"
+    )
+    parser.add_argument(
+        "--summary-file",
+        type=Path,
+        help="Captured mcp_replay summary (default: <run-file>.summary.txt)"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path('reports/precision_baseline.json'),
+        help="Baseline output path (default: reports/precision_baseline.json)"
+    )
+    args = parser.parse_args()
+
+    create_baseline(args.output, run_file=args.run_file, summary_file=args.summary_file)
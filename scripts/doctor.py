@@ -8,11 +8,28 @@ Checks system health and provides remediation steps.
 Requirements: Requirement 13 (Troubleshooting)
 """
 
+import argparse
+import atexit
+import json
 import sys
 import os
+import socket
+import stat
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,22 +39,269 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger('doctor', 'INFO')
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Successful check results are remembered in this file under the data directory
+CHECK_CACHE_FILENAME = '.doctor-cache.json'
+
+# Remediation when the HTTP stack itself is missing or broken
+MISSING_REQUESTS_REMEDIATION = ["Install dependencies: pip install -r requirements.txt"]
+
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = Lock()
+
+
+def _get_session() -> "requests.Session":
+    """
+    Pooled session shared by all Ollama probes, built on first use
+
+    requests is imported here rather than at module level so a broken
+    environment is reported as a failed check instead of crashing doctor.
+    No retries: a dead or hung Ollama should fail the check right away.
+
+    Raises:
+        ImportError: If requests (or urllib3) cannot be imported
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount('http://', HTTPAdapter(
+                max_retries=Retry(total=0, connect=0, read=0),
+                pool_connections=2,
+                pool_maxsize=4,
+            ))
+            atexit.register(session.close)
+            _SESSION = session
+        return _SESSION
+
+
+SQLITE_HEADER = b'SQLite format 3\x00'
+
+
+def _sqlite_ok(path: Path) -> bool:
+    """Whether path starts with the 16-byte SQLite file header."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+# Loopback addresses tried for "localhost" without a resolver round trip;
+# Ollama may listen on either (IPv6-only localhost is common on Windows/WSL)
+LOCALHOST_ADDRESSES = ('127.0.0.1', '::1')
+
+
+def _port_open(url: str, timeout: float = 0.5) -> bool:
+    """
+    Whether the host/port of url accepts TCP connections
+
+    A closed local port is refused immediately, so this fails in well under
+    a millisecond where an HTTP request would wait for its timeout. For
+    localhost both loopback addresses are tried before giving up.
+    """
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    hosts = LOCALHOST_ADDRESSES if parts.hostname == 'localhost' else (parts.hostname,)
+    for host in hosts:
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            continue
+    return False
+
 
 class HealthCheck:
     """System health checker"""
 
-    def __init__(self):
-        """Initialize health checker"""
+    def __init__(
+        self,
+        cache_ttl: float = 0,
+        cache_path: Optional[Path] = None,
+        fresh: bool = False,
+        deep: bool = False
+    ):
+        """
+        Initialize health checker
+
+        Args:
+            cache_ttl: Seconds a successful check result is reused across runs
+                (0 disables the cache)
+            cache_path: Cache file (default: .doctor-cache.json in the data directory)
+            fresh: Ignore cached results (fresh results are still cached)
+            deep: Open Chroma DB with chromadb even when its sqlite file looks healthy
+        """
         try:
             self.config = load_config()
         except Exception as e:
             logger.warning(f"Failed to load config: {e}")
             self.config = None
 
+        self.deep = deep
         self.checks = []
         self.passed = 0
         self.failed = 0
 
+        # /api/tags is fetched once and shared by the Ollama checks
+        self._tags_lock = Lock()
+        self._tags_result = None
+
+        # Filesystem probes: each path is stat'ed at most once per run
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+
+        # Successful results from recent runs, keyed by check name and
+        # only reused while the check's inputs are unchanged
+        self.cache_ttl = max(0.0, cache_ttl)
+        self.cache_path = cache_path or self._data_dir() / CHECK_CACHE_FILENAME
+        self._check_cache: Dict[str, Dict] = (
+            self._load_check_cache() if self.cache_ttl and not fresh else {}
+        )
+
+    def _data_dir(self) -> Path:
+        """Data directory from the loaded config (default when config failed to load)."""
+        if self.config:
+            return Path(self.config.data_dir)
+        return Path.home() / '.context-orchestrator'
+
+    def _check_inputs(self) -> Dict[str, List]:
+        """
+        Inputs each check depends on, used to invalidate cached results
+
+        Values are JSON-compatible so they compare equal after a round trip
+        through the cache file.
+
+        Returns:
+            Dict mapping check name to its inputs
+        """
+        if self.config:
+            url = self.config.ollama.url
+            models = [self.config.ollama.embedding_model, self.config.ollama.inference_model]
+        else:
+            url = "http://localhost:11434"
+            models = ["nomic-embed-text", "qwen2.5:7b"]
+        data_dir = str(self._data_dir())
+
+        return {
+            "Ollama Running": [url],
+            "Ollama Models": [url] + models,
+            "Data Directory": [data_dir],
+            "Chroma DB": [data_dir, self.deep],
+            "Config File": [str(Path.home()), os.getcwd()],
+        }
+
+    def _load_check_cache(self) -> Dict[str, Dict]:
+        """Load cached check results; a missing or corrupt file means no cache."""
+        try:
+            data = _loads(self.cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_check_cache(self) -> None:
+        """Persist cached check results (skipped if the directory is missing)."""
+        try:
+            self.cache_path.write_text(json.dumps(self._check_cache), encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Could not write doctor cache {self.cache_path}: {e}")
+
+    def _cached_check(
+        self,
+        name: str,
+        check_func: Callable[[], Tuple[bool, str, List[str]]],
+        inputs: Optional[List] = None
+    ) -> Tuple[bool, str, List[str]]:
+        """
+        Run a check, reusing a successful result younger than cache_ttl
+
+        Args:
+            name: Check name (cache key)
+            check_func: Check to run on a cache miss
+            inputs: Values the check depends on (URL, models, paths); a cached
+                result recorded for different inputs is not reused
+
+        Returns:
+            Tuple of (success, message, remediation_steps)
+        """
+        now = time.time()
+        inputs = list(inputs or [])
+        entry = self._check_cache.get(name)
+        if (
+            self.cache_ttl
+            and entry
+            and entry.get('inputs') == inputs
+            and now - entry.get('ts', 0) < self.cache_ttl
+        ):
+            success, message, remediation = entry['result']
+            return success, f"{message} (cached)", remediation
+
+        result = check_func()
+        if self.cache_ttl and result[0]:
+            self._check_cache[name] = {'ts': now, 'inputs': inputs, 'result': list(result)}
+        else:
+            self._check_cache.pop(name, None)
+        return result
+
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Stat a path once and share the result between checks
+
+        Args:
+            path: Path to probe
+
+        Returns:
+            stat result, or None if the path does not exist (including when
+            a parent component is a file, matching Path.exists())
+        """
+        key = str(path)
+        if key not in self._stat_cache:
+            try:
+                self._stat_cache[key] = os.stat(key)
+            except (FileNotFoundError, NotADirectoryError):
+                self._stat_cache[key] = None
+        return self._stat_cache[key]
+
+    def _get_ollama_tags(self, url: str) -> "requests.Response":
+        """
+        Fetch Ollama's /api/tags once and reuse it across checks
+
+        A failed request is remembered too, so concurrent checks don't each
+        wait out the timeout against a dead server.
+
+        Args:
+            url: Ollama base URL
+
+        Returns:
+            Response from /api/tags
+
+        Raises:
+            requests.exceptions.RequestException: If the request failed
+            ImportError: If requests is not installed
+        """
+        import requests
+
+        with self._tags_lock:
+            if self._tags_result is None:
+                try:
+                    # Cheap TCP probe first; only an open port gets the HTTP GET,
+                    # which then separates "not running" from "running but failing"
+                    if not _port_open(url):
+                        raise requests.exceptions.ConnectionError(
+                            f"Nothing is listening at {url}"
+                        )
+                    self._tags_result = _get_session().get(f"{url}/api/tags", timeout=5)
+                except requests.exceptions.RequestException as e:
+                    self._tags_result = e
+
+        if isinstance(self._tags_result, Exception):
+            raise self._tags_result
+        return self._tags_result
+
     def check_ollama_running(self) -> Tuple[bool, str, List[str]]:
         """
         Check if Ollama is running
@@ -53,7 +317,7 @@ class HealthCheck:
             else:
                 url = "http://localhost:11434"
 
-            response = requests.get(f"{url}/api/tags", timeout=5)
+            response = self._get_ollama_tags(url)
 
             if response.status_code == 200:
                 return True, f"Ollama is running at {url}", []
@@ -63,6 +327,9 @@ class HealthCheck:
                     f"Try restarting: ollama serve"
                 ]
 
+        except ImportError as e:
+            return False, f"Cannot check Ollama: {e}", MISSING_REQUESTS_REMEDIATION
+
         except requests.exceptions.ConnectionError:
             return False, "Ollama is not running", [
                 "Start Ollama: ollama serve",
@@ -83,8 +350,6 @@ class HealthCheck:
             Tuple of (success, message, remediation_steps)
         """
         try:
-            import requests
-
             if self.config:
                 url = self.config.ollama.url
                 embedding_model = self.config.ollama.embedding_model
@@ -94,24 +359,25 @@ class HealthCheck:
                 embedding_model = "nomic-embed-text"
                 inference_model = "qwen2.5:7b"
 
-            response = requests.get(f"{url}/api/tags", timeout=5)
+            response = self._get_ollama_tags(url)
 
             if response.status_code != 200:
                 return False, "Failed to list Ollama models", [
                     "Check Ollama is running: ollama serve"
                 ]
 
-            data = response.json()
-            installed_models = [model['name'] for model in data.get('models', [])]
+            data = _loads(response.content)
 
-            # Extract base model names (without tags like :latest)
-            installed_model_bases = [model.split(':')[0] for model in installed_models]
+            # Base model names (without tags like :latest), in a single pass
+            installed_model_bases = {
+                model['name'].split(':', 1)[0] for model in data.get('models', ())
+            }
 
             missing_models = []
 
             # Check models by base name (ignore tags)
-            embedding_base = embedding_model.split(':')[0]
-            inference_base = inference_model.split(':')[0]
+            embedding_base = embedding_model.split(':', 1)[0]
+            inference_base = inference_model.split(':', 1)[0]
 
             if embedding_base not in installed_model_bases:
                 missing_models.append(embedding_model)
@@ -129,6 +395,9 @@ class HealthCheck:
             else:
                 return True, f"Required models installed: {embedding_model}, {inference_model}", []
 
+        except ImportError as e:
+            return False, f"Cannot check models: {e}", MISSING_REQUESTS_REMEDIATION
+
         except Exception as e:
             return False, f"Failed to check models: {e}", [
                 "Check Ollama is running: ollama serve"
@@ -147,18 +416,19 @@ class HealthCheck:
             else:
                 data_dir = Path.home() / '.context-orchestrator'
 
-            # Check if directory exists
-            if not data_dir.exists():
+            # Check if directory exists (one stat answers both questions)
+            data_dir_stat = self._stat(data_dir)
+            if data_dir_stat is None:
                 return False, f"Data directory does not exist: {data_dir}", [
                     f"Create directory: mkdir {data_dir}"
                 ]
+            if not stat.S_ISDIR(data_dir_stat.st_mode):
+                return False, f"Data directory path is not a directory: {data_dir}", [
+                    f"Move the file out of the way: mv {data_dir} {data_dir}.bak"
+                ]
 
-            # Check if writable
-            test_file = data_dir / '.write_test'
-            try:
-                test_file.write_text('test', encoding='utf-8')
-                test_file.unlink()
-            except Exception:
+            # Check if writable (permission check only; no probe file written)
+            if not os.access(data_dir, os.W_OK):
                 return False, f"Data directory is not writable: {data_dir}", [
                     f"Check permissions: ls -la {data_dir.parent}"
                 ]
@@ -183,8 +453,18 @@ class HealthCheck:
 
             chroma_path = data_dir / 'chroma_db'
 
-            if not chroma_path.exists():
+            chroma_stat = self._stat(chroma_path)
+            if chroma_stat is None:
                 return True, f"Chroma DB will be created on first run: {chroma_path}", []
+            if not stat.S_ISDIR(chroma_stat.st_mode):
+                return False, f"Chroma DB path is not a directory: {chroma_path}", [
+                    f"Move the file out of the way: mv {chroma_path} {chroma_path}.bak"
+                ]
+
+            # A valid sqlite header is enough unless a deep check was asked for;
+            # importing chromadb and opening the client is far more expensive
+            if not self.deep and _sqlite_ok(chroma_path / 'chroma.sqlite3'):
+                return True, "Chroma DB OK: sqlite file looks healthy (use --deep to open it)", []
 
             # Try to load Chroma DB
             try:
@@ -217,7 +497,7 @@ class HealthCheck:
         ]
 
         for config_path in config_paths:
-            if config_path.exists():
+            if self._stat(config_path) is not None:
                 return True, f"Config file found: {config_path}", []
 
         return False, "Config file not found (using defaults)", [
@@ -229,6 +509,9 @@ class HealthCheck:
         """
         Run all health checks
 
+        The checks are independent and I/O-bound, so they run concurrently;
+        results are printed afterwards in the order listed below.
+
         Returns:
             True if all checks passed
         """
@@ -240,51 +523,80 @@ class HealthCheck:
             ("Config File", self.check_config_file)
         ]
 
-        print("=" * 60)
-        print("Context Orchestrator Health Check")
-        print("=" * 60)
-        print()
+        # Output is assembled into blocks and written with one call each
+        rule = "=" * 60
+        sys.stdout.write(f"{rule}\nContext Orchestrator Health Check\n{rule}\n\n")
+        sys.stdout.flush()
 
-        for name, check_func in checks:
-            print(f"Checking {name}...", end=" ")
+        inputs = self._check_inputs()
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [
+                (name, executor.submit(self._cached_check, name, check_func, inputs.get(name)))
+                for name, check_func in checks
+            ]
+        if self.cache_ttl:
+            self._save_check_cache()
 
+        lines: List[str] = []
+        for name, future in futures:
             try:
-                success, message, remediation = check_func()
+                success, message, remediation = future.result()
 
                 if success:
-                    print("✓ PASS")
-                    print(f"  {message}")
+                    lines.append(f"Checking {name}... ✓ PASS")
+                    lines.append(f"  {message}")
                     self.passed += 1
                 else:
-                    print("✗ FAIL")
-                    print(f"  {message}")
+                    lines.append(f"Checking {name}... ✗ FAIL")
+                    lines.append(f"  {message}")
 
                     if remediation:
-                        print("  Remediation:")
-                        for step in remediation:
-                            print(f"    - {step}")
+                        lines.append("  Remediation:")
+                        lines.extend(f"    - {step}" for step in remediation)
 
                     self.failed += 1
 
-                print()
-
             except Exception as e:
-                print("✗ ERROR")
-                print(f"  {e}")
+                lines.append(f"Checking {name}... ✗ ERROR")
+                lines.append(f"  {e}")
                 self.failed += 1
-                print()
+
+            lines.append("")
 
         # Summary
-        print("=" * 60)
-        print(f"Summary: {self.passed} passed, {self.failed} failed")
-        print("=" * 60)
+        lines.append(rule)
+        lines.append(f"Summary: {self.passed} passed, {self.failed} failed")
+        lines.append(rule)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         return self.failed == 0
 
 
 def main():
     """Main entry point"""
-    checker = HealthCheck()
+    parser = argparse.ArgumentParser(description="Context Orchestrator health check")
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore cached results and run every check (results are re-cached)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0.0,
+        help="Seconds to reuse successful check results from earlier runs "
+             "(default: 0, always run every check)"
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Open Chroma DB with chromadb instead of only checking its sqlite header"
+    )
+    args = parser.parse_args()
+
+    checker = HealthCheck(cache_ttl=args.cache_ttl, fresh=args.fresh, deep=args.deep)
     success = checker.run_all_checks()
 
     sys.exit(0 if success else 1)
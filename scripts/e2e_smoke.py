@@ -11,6 +11,7 @@ Runs a minimal end-to-end flow using the real runtime:
 - Print concise results to stdout
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from src.config import load_config
@@ -20,6 +21,7 @@ from src.utils.logger import setup_logger
 
 def main() -> int:
     logger = setup_logger('e2e_smoke', 'INFO')
+    now = datetime.now()
 
     config = load_config('config.yaml')
 
@@ -52,7 +54,7 @@ def main() -> int:
     project_id = None
     if project_manager:
         project = project_manager.create_project(
-            name=f"Smoke Test Project {datetime.now().strftime('%H%M%S')}",
+            name=f"Smoke Test Project {now.strftime('%H%M%S')}",
             description="Temporary project for e2e smoke test",
             tags=["smoke", "test"],
         )
@@ -67,7 +69,7 @@ def main() -> int:
             'Example:\n```python\nx = "5"\ny = 10\nresult = x + y  # TypeError\n```\n'
             'Fix by converting types:\n```python\nresult = int(x) + y\n```'
         ),
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'source': 'smoke_test',
         'refs': ['https://docs.python.org/3/tutorial/errors.html#typeerror'],
         'metadata': {'origin': 'smoke'},
@@ -78,8 +80,17 @@ def main() -> int:
     memory_id = ingestion_service.ingest_conversation(conversation)
     print(f"Ingested memory: {memory_id}")
 
+    # Global and project-scoped (Phase 15) searches are independent; run both at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        global_future = executor.submit(search_service.search, 'Python TypeError fix', top_k=5)
+        project_future = (
+            executor.submit(search_service.search_in_project, project_id, 'TypeError', top_k=5)
+            if project_id else None
+        )
+        results = global_future.result()
+        proj_results = project_future.result() if project_future else None
+
     # Global search
-    results = search_service.search('Python TypeError fix', top_k=5)
     print(f"Global search results: {len(results)}")
     if results:
         top = results[0]
@@ -88,7 +99,6 @@ def main() -> int:
 
     # Project-scoped search (Phase 15)
     if project_id:
-        proj_results = search_service.search_in_project(project_id, 'TypeError', top_k=5)
         print(f"Project search results: {len(proj_results)} (project_id={project_id})")
         if proj_results:
             top = proj_results[0]
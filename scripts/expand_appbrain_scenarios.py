@@ -9,9 +9,278 @@ Adds 30 OrchestratorX conversations and 15 OrchestratorX queries to measure:
 """
 
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# json.dump issues one write per encoder chunk; a large buffer turns them into a few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# query_runs.json is only read by the replay tooling; COMPACT_JSON=1 skips pretty-printing it.
+# Indented output stays the default so the checked-in fixture diffs cleanly.
+COMPACT_QUERY_JSON = os.environ.get('COMPACT_JSON', '').lower() in ('1', 'true', 'yes')
+
+# OrchestratorX conversations: (user, assistant, source, ref, topic, doc_type).
+CONVERSATION_ROWS = [
+    # Architecture & Design (5)
+    (
+        'How should we structure the vector indexing pipeline for OrchestratorX?',
+        'Use a two-stage approach: first embed documents with nomic-embed-text, then index in Chroma DB with metadata filters. Keep batch size at 100 docs for optimal throughput.',
+        'scenario_architecture', 'OrchestratorX-VectorPipeline', 'vector_indexing', 'design',
+    ),
+    (
+        'What chunking strategy should we use for long documents in OrchestratorX?',
+        'Split by markdown headings first, then by paragraphs if chunks exceed 512 tokens. Never split code blocks. Use tiktoken for accurate token counting.',
+        'scenario_architecture', 'OrchestratorX-ChunkStrategy', 'chunking', 'design',
+    ),
+    (
+        'How do we handle concurrent writes to vector database in OrchestratorX?',
+        'Chroma DB handles concurrency internally. For high-throughput scenarios, queue writes in batches and use background workers with exponential backoff on conflicts.',
+        'scenario_architecture', 'OrchestratorX-Concurrency', 'concurrency', 'design',
+    ),
+    (
+        'What caching strategy for embeddings in OrchestratorX?',
+        'Implement 3-layer cache: L1 exact matches (LRU, 128 entries), L2 keyword matches (top 3), L3 semantic similarity (cosine >0.85). TTL 8 hours.',
+        'scenario_architecture', 'OrchestratorX-CacheDesign', 'caching', 'design',
+    ),
+    (
+        'How to implement project-scoped search in OrchestratorX?',
+        'Add project_id to metadata filters. When project confirmed (confidence >0.75), pre-load memory pool and filter candidates before reranking. Expected 70% reduction.',
+        'scenario_architecture', 'OrchestratorX-ProjectScope', 'project_search', 'design',
+    ),
+    # Implementation & Code (10)
+    (
+        'Show me the code for generating embeddings in OrchestratorX.',
+        'Use ModelRouter.generate_embedding(text). Returns List[float] with 768 dimensions from nomic-embed-text. Cache results in memory pool for reuse.',
+        'scenario_code', 'OrchestratorX-EmbeddingCode', 'embedding_generation', 'snippet',
+    ),
+    (
+        'How do we filter candidates by memory IDs in OrchestratorX?',
+        'Use list comprehension: pool_candidates = [c for c in all_candidates if get_memory_id(c) in memory_ids]. Reduces 100 to ~30 candidates.',
+        'scenario_code', 'OrchestratorX-FilterCode', 'candidate_filtering', 'snippet',
+    ),
+    (
+        'What is the cross-encoder reranking flow in OrchestratorX?',
+        'Check L1/L2/L3 caches first. If miss, call LLM to score (query, candidate) pair. Store in all 3 caches. Use 3-parallel execution for throughput.',
+        'scenario_code', 'OrchestratorX-RerankFlow', 'reranking', 'process',
+    ),
+    (
+        'How to warm the semantic cache in OrchestratorX?',
+        'Call ProjectMemoryPool.warm_cache(reranker, project_id). Loads all project memories, generates embeddings, and populates L3 cache. Query-agnostic optimization.',
+        'scenario_code', 'OrchestratorX-WarmCache', 'cache_warming', 'snippet',
+    ),
+    (
+        'Show the graduated degradation workflow implementation in OrchestratorX.',
+        'Step 1: search_within_pool(). Step 2: is_result_sufficient() check. Step 3: If insufficient, fallback to full search. Logs "Pool filtering: X→Y candidates".',
+        'scenario_code', 'OrchestratorX-WorkflowA', 'graduated_degradation', 'process',
+    ),
+    (
+        'How do we calculate result sufficiency in OrchestratorX?',
+        'Check: len(results) >= top_k AND min_score >= 0.3. Returns True if both conditions met, False otherwise.',
+        'scenario_code', 'OrchestratorX-Sufficiency', 'result_sufficiency', 'snippet',
+    ),
+    (
+        'What is the memory pool loading logic in OrchestratorX?',
+        'Fetch memories by project_id with is_memory_entry=True filter. Sort by created_at desc. Limit to max_memories_per_project (default 100). Generate embeddings for each.',
+        'scenario_code', 'OrchestratorX-PoolLoading', 'memory_pool_loading', 'process',
+    ),
+    (
+        'How do we extract memory IDs from candidates in OrchestratorX?',
+        'Check metadata.memory_id for chunks, or use candidate ID if is_memory_entry=True. Return empty string if neither found.',
+        'scenario_code', 'OrchestratorX-MemoryIDExtraction', 'memory_id_extraction', 'snippet',
+    ),
+    (
+        'Show the prefetch_project implementation in OrchestratorX.',
+        'Dual strategy: (1) ProjectMemoryPool.warm_cache() for L3, (2) Execute prefetch queries for L1/L2. Logs pool_stats with memories_loaded and cache_entries_added.',
+        'scenario_code', 'OrchestratorX-Prefetch', 'prefetch_project', 'process',
+    ),
+    (
+        'What parallel execution strategy does OrchestratorX use?',
+        'Use ThreadPoolExecutor with max_workers=2 for vector+BM25 search, max_workers=3 for cross-encoder reranking. Reduces latency from 118s to 40s per query.',
+        'scenario_code', 'OrchestratorX-Parallel', 'parallel_execution', 'design',
+    ),
+    # Operations & Monitoring (5)
+    (
+        'How do we monitor cache hit rates in OrchestratorX?',
+        'Call get_reranker_metrics() MCP tool. Returns L1/L2/L3 hit rates, LLM call count, avg latency. Target: total hit rate >60%.',
+        'scenario_ops', 'OrchestratorX-CacheMetrics', 'monitoring', 'runbook',
+    ),
+    (
+        'What performance targets for OrchestratorX search?',
+        'Search latency ≤200ms (typical 80ms without reranking). LLM calls ≤20 per query. Cache hit rate ≥60%. Precision ≥84%. Zero-hit queries = 0.',
+        'scenario_ops', 'OrchestratorX-PerformanceTargets', 'performance_targets', 'specification',
+    ),
+    (
+        'How to debug memory pool filtering in OrchestratorX?',
+        'Check logs for "Pool filtering: X→Y candidates". If Y=0, verify project_id metadata. If Y=X, memory pool not loaded. Expected ratio ~30%.',
+        'scenario_ops', 'OrchestratorX-DebugPool', 'debugging', 'runbook',
+    ),
+    (
+        'What triggers project memory pool loading in OrchestratorX?',
+        'SessionManager.set_project_hint() with confidence >0.75 triggers prefetch_project(). This loads pool and warms L3 cache automatically.',
+        'scenario_ops', 'OrchestratorX-PoolTrigger', 'pool_loading_trigger', 'process',
+    ),
+    (
+        'How to measure memory pool effectiveness in OrchestratorX?',
+        'Compare LLM calls before/after pool integration. Track candidate reduction ratio (expect 70%). Monitor L3 cache hit rate (target >40%).',
+        'scenario_ops', 'OrchestratorX-PoolEffectiveness', 'effectiveness_measurement', 'analysis',
+    ),
+    # Configuration & Tuning (5)
+    (
+        'What are key config parameters for OrchestratorX memory pool?',
+        'max_memories_per_project: 100, pool_ttl_seconds: 28800 (8h), project_prefetch_min_confidence: 0.75, semantic_similarity_threshold: 0.85.',
+        'scenario_config', 'OrchestratorX-PoolConfig', 'configuration', 'specification',
+    ),
+    (
+        'How to tune semantic similarity threshold in OrchestratorX?',
+        'Default 0.85 is conservative. Lower to 0.70-0.75 for higher hit rate (trade precision). Measure via get_reranker_metrics() after changes.',
+        'scenario_config', 'OrchestratorX-ThresholdTuning', 'threshold_tuning', 'guidance',
+    ),
+    (
+        'What cache sizes should we use in OrchestratorX?',
+        'L1/L2: 128 entries each (OrderedDict with LRU eviction). L3: unlimited (Dict per candidate_id). TTL: 28800s (8 hours) for all layers.',
+        'scenario_config', 'OrchestratorX-CacheSizes', 'cache_sizing', 'specification',
+    ),
+    (
+        'How many parallel reranking workers for OrchestratorX?',
+        'cross_encoder_max_parallel: 3 (default). Increase to 5-10 if CPU allows. Monitor queue_wait_ms via metrics. Use fallback_mode: heuristic if wait >500ms.',
+        'scenario_config', 'OrchestratorX-ParallelTuning', 'parallel_tuning', 'guidance',
+    ),
+    (
+        'What prefetch queries should we use for OrchestratorX?',
+        'Use actual user query patterns. Default: "project status", "open issues", "risk summary". Update based on query_runs.json analysis. Max 3 queries.',
+        'scenario_config', 'OrchestratorX-PrefetchQueries', 'prefetch_queries', 'guidance',
+    ),
+    # Testing & Validation (5)
+    (
+        'How to test memory pool functionality in OrchestratorX?',
+        'Unit tests: test_load_project, test_warm_cache, test_get_memory_ids. Integration: check pool_stats in prefetch_project response. Verify >0 memories_loaded.',
+        'scenario_testing', 'OrchestratorX-PoolTesting', 'testing', 'guidance',
+    ),
+    (
+        'What regression tests validate OrchestratorX memory pool?',
+        'Run mcp_replay with OrchestratorX-heavy scenarios. Verify: Precision ≥84%, LLM calls reduction, cache hit rate increase. Check zero_hits.json for regressions.',
+        'scenario_testing', 'OrchestratorX-RegressionTests', 'regression_testing', 'process',
+    ),
+    (
+        'How to validate cache warming in OrchestratorX?',
+        'Check logs for "[Prefetch] Warmed L3 cache" with >0 memories_loaded. Query same project immediately after—L3 hit rate should spike.',
+        'scenario_testing', 'OrchestratorX-CacheValidation', 'cache_validation', 'process',
+    ),
+    (
+        'What are success criteria for OrchestratorX memory pool?',
+        'LLM calls ≤20 per query (vs 44 baseline). Candidate reduction 100→30 (70%). L3 cache hit rate >40%. Precision maintained ≥84%.',
+        'scenario_testing', 'OrchestratorX-SuccessCriteria', 'success_criteria', 'specification',
+    ),
+    (
+        'How to measure graduated degradation effectiveness in OrchestratorX?',
+        'Parse logs for "Pool filtering" and "Sufficient results from pool". Calculate pool-only success rate. Target: >70% queries satisfied by pool alone.',
+        'scenario_testing', 'OrchestratorX-WorkflowAMetrics', 'workflow_metrics', 'analysis',
+    ),
+]
+
+# OrchestratorX queries: (query, topic)
+QUERY_ROWS = [
+    ('How does vector indexing work in OrchestratorX?', 'vector_indexing'),
+    ('What is the chunking strategy for OrchestratorX documents?', 'chunking'),
+    ('Explain OrchestratorX caching layers', 'caching'),
+    ('How to filter candidates in OrchestratorX memory pool?', 'candidate_filtering'),
+    ('Show me graduated degradation workflow in OrchestratorX', 'graduated_degradation'),
+    ('How does prefetch_project work in OrchestratorX?', 'prefetch_project'),
+    ('What are OrchestratorX performance targets?', 'performance_targets'),
+    ('How to debug memory pool filtering in OrchestratorX?', 'debugging'),
+    ('OrchestratorX cache warming process', 'cache_warming'),
+    ('Tune semantic similarity threshold in OrchestratorX', 'threshold_tuning'),
+    ('OrchestratorX memory pool configuration parameters', 'configuration'),
+    ('How to test OrchestratorX memory pool?', 'testing'),
+    ('OrchestratorX regression testing procedure', 'regression_testing'),
+    ('What are success criteria for OrchestratorX pool?', 'success_criteria'),
+    ('Measure memory pool effectiveness in OrchestratorX', 'effectiveness_measurement'),
+]
+
+
+# Line-leading key of the conversations array in json.dump(indent=2) output
+CONVERSATIONS_KEY = b'\n  "conversations": ['
+
+
+def _splice_conversations(raw, new_conversations):
+    """
+    Append conversations to scenario_data.json without parsing or re-serializing it.
+
+    Expects the layout written by json.dump(indent=2) with "conversations" as
+    the last key of the top-level object. JSON strings cannot contain raw
+    newlines, so the line-leading key and closing bracket are located by a
+    byte scan and the existing entries are never decoded. Only the new
+    entries are encoded. Existing entries are counted by their line-leading
+    '{' at the array's indentation.
+
+    Args:
+        raw: Current file contents (UTF-8 bytes)
+        new_conversations: Conversation dicts to append
+
+    Returns:
+        Tuple of (new file contents, total conversation count), or None if
+        the layout was not recognised
+    """
+    key = raw.rfind(CONVERSATIONS_KEY)
+    body = raw.rstrip()
+    if key < 0 or not body.endswith(b'}'):
+        return None
+    inner = body[:-1].rstrip()
+    array_start = key + len(CONVERSATIONS_KEY)
+    close = len(inner) - 1
+    if not inner.endswith(b']') or close < array_start:
+        return None
+    # Another top-level key or closing bracket means the array ends elsewhere
+    existing = raw[array_start:close]
+    if b'\n  "' in existing or b'\n  ]' in existing:
+        return None
+    total = existing.count(b'\n    {') + len(new_conversations)
+    if not new_conversations:
+        return raw, total
+
+    # Serialize at the nesting depth the entries have in the file
+    wrapped = _dumps_indented({'conversations': new_conversations})
+    entries = wrapped[wrapped.index(b'[') + 1:wrapped.rindex(b']')].strip(b'\n ')
+
+    head = raw[:close].rstrip()
+    separator = b'\n    ' if head.endswith(b'[') else b',\n    '
+    return head + separator + entries + b'\n  ' + raw[close:], total
+
+
+def _dumps_indented(data):
+    """Serialize data as UTF-8 JSON bytes with 2-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json(path, data, compact=False):
+    """
+    Write data as JSON, in one write with orjson or through a large buffer.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+        compact: Drop indentation and separator whitespace
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data) if compact else _dumps_indented(data))
+        return
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        if compact:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 def expand_scenarios():
     """Add OrchestratorX-focused conversations and queries."""
 
@@ -20,455 +289,69 @@ def expand_scenarios():
     query_file = Path('tests/scenarios/query_runs.json')
 
     # Load existing data
-    with open(scenario_file, 'r', encoding='utf-8') as f:
-        scenario_data = json.load(f)
+    scenario_raw = scenario_file.read_bytes()
 
-    with open(query_file, 'r', encoding='utf-8') as f:
-        query_data = json.load(f)
+    query_data = _loads(query_file.read_bytes())
 
     # Base timestamp
     base_time = datetime(2025, 11, 1, 10, 0, 0)
 
-    # 30 new OrchestratorX conversations
+    # 30 new OrchestratorX conversations, one hour apart
+    timestamps = [
+        (base_time + timedelta(hours=i + 1)).isoformat()
+        for i in range(len(CONVERSATION_ROWS))
+    ]
     new_conversations = [
-        # Architecture & Design (5)
-        {
-            'user': 'How should we structure the vector indexing pipeline for OrchestratorX?',
-            'assistant': 'Use a two-stage approach: first embed documents with nomic-embed-text, then index in Chroma DB with metadata filters. Keep batch size at 100 docs for optimal throughput.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_architecture',
-            'refs': ['OrchestratorX-VectorPipeline'],
-            'metadata': {'topic': 'vector_indexing', 'doc_type': 'design'},
-            'timestamp': (base_time + timedelta(hours=1)).isoformat()
-        },
-        {
-            'user': 'What chunking strategy should we use for long documents in OrchestratorX?',
-            'assistant': 'Split by markdown headings first, then by paragraphs if chunks exceed 512 tokens. Never split code blocks. Use tiktoken for accurate token counting.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_architecture',
-            'refs': ['OrchestratorX-ChunkStrategy'],
-            'metadata': {'topic': 'chunking', 'doc_type': 'design'},
-            'timestamp': (base_time + timedelta(hours=2)).isoformat()
-        },
-        {
-            'user': 'How do we handle concurrent writes to vector database in OrchestratorX?',
-            'assistant': 'Chroma DB handles concurrency internally. For high-throughput scenarios, queue writes in batches and use background workers with exponential backoff on conflicts.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_architecture',
-            'refs': ['OrchestratorX-Concurrency'],
-            'metadata': {'topic': 'concurrency', 'doc_type': 'design'},
-            'timestamp': (base_time + timedelta(hours=3)).isoformat()
-        },
-        {
-            'user': 'What caching strategy for embeddings in OrchestratorX?',
-            'assistant': 'Implement 3-layer cache: L1 exact matches (LRU, 128 entries), L2 keyword matches (top 3), L3 semantic similarity (cosine >0.85). TTL 8 hours.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_architecture',
-            'refs': ['OrchestratorX-CacheDesign'],
-            'metadata': {'topic': 'caching', 'doc_type': 'design'},
-            'timestamp': (base_time + timedelta(hours=4)).isoformat()
-        },
-        {
-            'user': 'How to implement project-scoped search in OrchestratorX?',
-            'assistant': 'Add project_id to metadata filters. When project confirmed (confidence >0.75), pre-load memory pool and filter candidates before reranking. Expected 70% reduction.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_architecture',
-            'refs': ['OrchestratorX-ProjectScope'],
-            'metadata': {'topic': 'project_search', 'doc_type': 'design'},
-            'timestamp': (base_time + timedelta(hours=5)).isoformat()
-        },
-        # Implementation & Code (10)
-        {
-            'user': 'Show me the code for generating embeddings in OrchestratorX.',
-            'assistant': 'Use ModelRouter.generate_embedding(text). Returns List[float] with 768 dimensions from nomic-embed-text. Cache results in memory pool for reuse.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-EmbeddingCode'],
-            'metadata': {'topic': 'embedding_generation', 'doc_type': 'snippet'},
-            'timestamp': (base_time + timedelta(hours=6)).isoformat()
-        },
-        {
-            'user': 'How do we filter candidates by memory IDs in OrchestratorX?',
-            'assistant': 'Use list comprehension: pool_candidates = [c for c in all_candidates if get_memory_id(c) in memory_ids]. Reduces 100 to ~30 candidates.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-FilterCode'],
-            'metadata': {'topic': 'candidate_filtering', 'doc_type': 'snippet'},
-            'timestamp': (base_time + timedelta(hours=7)).isoformat()
-        },
-        {
-            'user': 'What is the cross-encoder reranking flow in OrchestratorX?',
-            'assistant': 'Check L1/L2/L3 caches first. If miss, call LLM to score (query, candidate) pair. Store in all 3 caches. Use 3-parallel execution for throughput.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-RerankFlow'],
-            'metadata': {'topic': 'reranking', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=8)).isoformat()
-        },
-        {
-            'user': 'How to warm the semantic cache in OrchestratorX?',
-            'assistant': 'Call ProjectMemoryPool.warm_cache(reranker, project_id). Loads all project memories, generates embeddings, and populates L3 cache. Query-agnostic optimization.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-WarmCache'],
-            'metadata': {'topic': 'cache_warming', 'doc_type': 'snippet'},
-            'timestamp': (base_time + timedelta(hours=9)).isoformat()
-        },
-        {
-            'user': 'Show the graduated degradation workflow implementation in OrchestratorX.',
-            'assistant': 'Step 1: search_within_pool(). Step 2: is_result_sufficient() check. Step 3: If insufficient, fallback to full search. Logs "Pool filtering: X→Y candidates".',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-WorkflowA'],
-            'metadata': {'topic': 'graduated_degradation', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=10)).isoformat()
-        },
         {
-            'user': 'How do we calculate result sufficiency in OrchestratorX?',
-            'assistant': 'Check: len(results) >= top_k AND min_score >= 0.3. Returns True if both conditions met, False otherwise.',
+            'user': user,
+            'assistant': assistant,
             'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-Sufficiency'],
-            'metadata': {'topic': 'result_sufficiency', 'doc_type': 'snippet'},
-            'timestamp': (base_time + timedelta(hours=11)).isoformat()
-        },
-        {
-            'user': 'What is the memory pool loading logic in OrchestratorX?',
-            'assistant': 'Fetch memories by project_id with is_memory_entry=True filter. Sort by created_at desc. Limit to max_memories_per_project (default 100). Generate embeddings for each.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-PoolLoading'],
-            'metadata': {'topic': 'memory_pool_loading', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=12)).isoformat()
-        },
-        {
-            'user': 'How do we extract memory IDs from candidates in OrchestratorX?',
-            'assistant': 'Check metadata.memory_id for chunks, or use candidate ID if is_memory_entry=True. Return empty string if neither found.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-MemoryIDExtraction'],
-            'metadata': {'topic': 'memory_id_extraction', 'doc_type': 'snippet'},
-            'timestamp': (base_time + timedelta(hours=13)).isoformat()
-        },
-        {
-            'user': 'Show the prefetch_project implementation in OrchestratorX.',
-            'assistant': 'Dual strategy: (1) ProjectMemoryPool.warm_cache() for L3, (2) Execute prefetch queries for L1/L2. Logs pool_stats with memories_loaded and cache_entries_added.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-Prefetch'],
-            'metadata': {'topic': 'prefetch_project', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=14)).isoformat()
-        },
-        {
-            'user': 'What parallel execution strategy does OrchestratorX use?',
-            'assistant': 'Use ThreadPoolExecutor with max_workers=2 for vector+BM25 search, max_workers=3 for cross-encoder reranking. Reduces latency from 118s to 40s per query.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_code',
-            'refs': ['OrchestratorX-Parallel'],
-            'metadata': {'topic': 'parallel_execution', 'doc_type': 'design'},
-            'timestamp': (base_time + timedelta(hours=15)).isoformat()
-        },
-        # Operations & Monitoring (5)
-        {
-            'user': 'How do we monitor cache hit rates in OrchestratorX?',
-            'assistant': 'Call get_reranker_metrics() MCP tool. Returns L1/L2/L3 hit rates, LLM call count, avg latency. Target: total hit rate >60%.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_ops',
-            'refs': ['OrchestratorX-CacheMetrics'],
-            'metadata': {'topic': 'monitoring', 'doc_type': 'runbook'},
-            'timestamp': (base_time + timedelta(hours=16)).isoformat()
-        },
-        {
-            'user': 'What performance targets for OrchestratorX search?',
-            'assistant': 'Search latency ≤200ms (typical 80ms without reranking). LLM calls ≤20 per query. Cache hit rate ≥60%. Precision ≥84%. Zero-hit queries = 0.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_ops',
-            'refs': ['OrchestratorX-PerformanceTargets'],
-            'metadata': {'topic': 'performance_targets', 'doc_type': 'specification'},
-            'timestamp': (base_time + timedelta(hours=17)).isoformat()
-        },
-        {
-            'user': 'How to debug memory pool filtering in OrchestratorX?',
-            'assistant': 'Check logs for "Pool filtering: X→Y candidates". If Y=0, verify project_id metadata. If Y=X, memory pool not loaded. Expected ratio ~30%.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_ops',
-            'refs': ['OrchestratorX-DebugPool'],
-            'metadata': {'topic': 'debugging', 'doc_type': 'runbook'},
-            'timestamp': (base_time + timedelta(hours=18)).isoformat()
-        },
-        {
-            'user': 'What triggers project memory pool loading in OrchestratorX?',
-            'assistant': 'SessionManager.set_project_hint() with confidence >0.75 triggers prefetch_project(). This loads pool and warms L3 cache automatically.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_ops',
-            'refs': ['OrchestratorX-PoolTrigger'],
-            'metadata': {'topic': 'pool_loading_trigger', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=19)).isoformat()
-        },
-        {
-            'user': 'How to measure memory pool effectiveness in OrchestratorX?',
-            'assistant': 'Compare LLM calls before/after pool integration. Track candidate reduction ratio (expect 70%). Monitor L3 cache hit rate (target >40%).',
-            'project': 'OrchestratorX',
-            'source': 'scenario_ops',
-            'refs': ['OrchestratorX-PoolEffectiveness'],
-            'metadata': {'topic': 'effectiveness_measurement', 'doc_type': 'analysis'},
-            'timestamp': (base_time + timedelta(hours=20)).isoformat()
-        },
-        # Configuration & Tuning (5)
-        {
-            'user': 'What are key config parameters for OrchestratorX memory pool?',
-            'assistant': 'max_memories_per_project: 100, pool_ttl_seconds: 28800 (8h), project_prefetch_min_confidence: 0.75, semantic_similarity_threshold: 0.85.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_config',
-            'refs': ['OrchestratorX-PoolConfig'],
-            'metadata': {'topic': 'configuration', 'doc_type': 'specification'},
-            'timestamp': (base_time + timedelta(hours=21)).isoformat()
-        },
-        {
-            'user': 'How to tune semantic similarity threshold in OrchestratorX?',
-            'assistant': 'Default 0.85 is conservative. Lower to 0.70-0.75 for higher hit rate (trade precision). Measure via get_reranker_metrics() after changes.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_config',
-            'refs': ['OrchestratorX-ThresholdTuning'],
-            'metadata': {'topic': 'threshold_tuning', 'doc_type': 'guidance'},
-            'timestamp': (base_time + timedelta(hours=22)).isoformat()
-        },
-        {
-            'user': 'What cache sizes should we use in OrchestratorX?',
-            'assistant': 'L1/L2: 128 entries each (OrderedDict with LRU eviction). L3: unlimited (Dict per candidate_id). TTL: 28800s (8 hours) for all layers.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_config',
-            'refs': ['OrchestratorX-CacheSizes'],
-            'metadata': {'topic': 'cache_sizing', 'doc_type': 'specification'},
-            'timestamp': (base_time + timedelta(hours=23)).isoformat()
-        },
-        {
-            'user': 'How many parallel reranking workers for OrchestratorX?',
-            'assistant': 'cross_encoder_max_parallel: 3 (default). Increase to 5-10 if CPU allows. Monitor queue_wait_ms via metrics. Use fallback_mode: heuristic if wait >500ms.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_config',
-            'refs': ['OrchestratorX-ParallelTuning'],
-            'metadata': {'topic': 'parallel_tuning', 'doc_type': 'guidance'},
-            'timestamp': (base_time + timedelta(hours=24)).isoformat()
-        },
-        {
-            'user': 'What prefetch queries should we use for OrchestratorX?',
-            'assistant': 'Use actual user query patterns. Default: "project status", "open issues", "risk summary". Update based on query_runs.json analysis. Max 3 queries.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_config',
-            'refs': ['OrchestratorX-PrefetchQueries'],
-            'metadata': {'topic': 'prefetch_queries', 'doc_type': 'guidance'},
-            'timestamp': (base_time + timedelta(hours=25)).isoformat()
-        },
-        # Testing & Validation (5)
-        {
-            'user': 'How to test memory pool functionality in OrchestratorX?',
-            'assistant': 'Unit tests: test_load_project, test_warm_cache, test_get_memory_ids. Integration: check pool_stats in prefetch_project response. Verify >0 memories_loaded.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_testing',
-            'refs': ['OrchestratorX-PoolTesting'],
-            'metadata': {'topic': 'testing', 'doc_type': 'guidance'},
-            'timestamp': (base_time + timedelta(hours=26)).isoformat()
-        },
-        {
-            'user': 'What regression tests validate OrchestratorX memory pool?',
-            'assistant': 'Run mcp_replay with OrchestratorX-heavy scenarios. Verify: Precision ≥84%, LLM calls reduction, cache hit rate increase. Check zero_hits.json for regressions.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_testing',
-            'refs': ['OrchestratorX-RegressionTests'],
-            'metadata': {'topic': 'regression_testing', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=27)).isoformat()
-        },
-        {
-            'user': 'How to validate cache warming in OrchestratorX?',
-            'assistant': 'Check logs for "[Prefetch] Warmed L3 cache" with >0 memories_loaded. Query same project immediately after—L3 hit rate should spike.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_testing',
-            'refs': ['OrchestratorX-CacheValidation'],
-            'metadata': {'topic': 'cache_validation', 'doc_type': 'process'},
-            'timestamp': (base_time + timedelta(hours=28)).isoformat()
-        },
-        {
-            'user': 'What are success criteria for OrchestratorX memory pool?',
-            'assistant': 'LLM calls ≤20 per query (vs 44 baseline). Candidate reduction 100→30 (70%). L3 cache hit rate >40%. Precision maintained ≥84%.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_testing',
-            'refs': ['OrchestratorX-SuccessCriteria'],
-            'metadata': {'topic': 'success_criteria', 'doc_type': 'specification'},
-            'timestamp': (base_time + timedelta(hours=29)).isoformat()
-        },
-        {
-            'user': 'How to measure graduated degradation effectiveness in OrchestratorX?',
-            'assistant': 'Parse logs for "Pool filtering" and "Sufficient results from pool". Calculate pool-only success rate. Target: >70% queries satisfied by pool alone.',
-            'project': 'OrchestratorX',
-            'source': 'scenario_testing',
-            'refs': ['OrchestratorX-WorkflowAMetrics'],
-            'metadata': {'topic': 'workflow_metrics', 'doc_type': 'analysis'},
-            'timestamp': (base_time + timedelta(hours=30)).isoformat()
-        },
+            'source': source,
+            'refs': [ref],
+            'metadata': {'topic': topic, 'doc_type': doc_type},
+            'timestamp': timestamp
+        }
+        for (user, assistant, source, ref, topic, doc_type), timestamp
+        in zip(CONVERSATION_ROWS, timestamps, strict=True)
     ]
 
-    # Add to scenario data
-    scenario_data['conversations'].extend(new_conversations)
-
-    # Write back
-    with open(scenario_file, 'w', encoding='utf-8') as f:
-        json.dump(scenario_data, f, indent=2, ensure_ascii=False)
+    # Splice into scenario data; fall back to a full rewrite if the layout is unexpected
+    spliced = _splice_conversations(scenario_raw, new_conversations)
+    if spliced is not None:
+        scenario_bytes, total_conversations = spliced
+        scenario_file.write_bytes(scenario_bytes)
+    else:
+        scenario_data = _loads(scenario_raw)
+        scenario_data['conversations'].extend(new_conversations)
+        total_conversations = len(scenario_data['conversations'])
+        _write_json(scenario_file, scenario_data)
 
     print(f'[OK] Added {len(new_conversations)} OrchestratorX conversations to scenario_data.json')
-    print(f'   Total conversations: {len(scenario_data["conversations"])}')
+    print(f'   Total conversations: {total_conversations}')
 
     # Now add 15 OrchestratorX queries
-    new_queries = [
-        {
-            'query': 'How does vector indexing work in OrchestratorX?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'vector_indexing',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'What is the chunking strategy for OrchestratorX documents?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'chunking',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'Explain OrchestratorX caching layers',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'caching',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'How to filter candidates in OrchestratorX memory pool?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'candidate_filtering',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'Show me graduated degradation workflow in OrchestratorX',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'graduated_degradation',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'How does prefetch_project work in OrchestratorX?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'prefetch_project',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'What are OrchestratorX performance targets?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'performance_targets',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'How to debug memory pool filtering in OrchestratorX?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'debugging',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'OrchestratorX cache warming process',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'cache_warming',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'Tune semantic similarity threshold in OrchestratorX',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'threshold_tuning',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'OrchestratorX memory pool configuration parameters',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'configuration',
-                'expected_results': 3
-            }
-        },
+    query_data.extend(
         {
-            'query': 'How to test OrchestratorX memory pool?',
+            'query': query,
             'expected_memory_ids': [],
             'metadata': {
                 'project': 'OrchestratorX',
-                'topic': 'testing',
+                'topic': topic,
                 'expected_results': 3
             }
-        },
-        {
-            'query': 'OrchestratorX regression testing procedure',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'regression_testing',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'What are success criteria for OrchestratorX pool?',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'success_criteria',
-                'expected_results': 3
-            }
-        },
-        {
-            'query': 'Measure memory pool effectiveness in OrchestratorX',
-            'expected_memory_ids': [],
-            'metadata': {
-                'project': 'OrchestratorX',
-                'topic': 'effectiveness_measurement',
-                'expected_results': 3
-            }
-        },
-    ]
-
-    query_data.extend(new_queries)
+        }
+        for query, topic in QUERY_ROWS
+    )
 
     # Write back
-    with open(query_file, 'w', encoding='utf-8') as f:
-        json.dump(query_data, f, indent=2, ensure_ascii=False)
+    _write_json(query_file, query_data, compact=COMPACT_QUERY_JSON)
 
-    print(f'[OK] Added {len(new_queries)} OrchestratorX queries to query_runs.json')
+    print(f'[OK] Added {len(QUERY_ROWS)} OrchestratorX queries to query_runs.json')
     print(f'   Total queries: {len(query_data)}')
 
     print('\n[Summary]:')
     print(f'   - OrchestratorX conversations: 8 → {8 + len(new_conversations)} (+{len(new_conversations)})')
-    print(f'   - OrchestratorX queries: 0 → {len(new_queries)} (+{len(new_queries)})')
+    print(f'   - OrchestratorX queries: 0 → {len(QUERY_ROWS)} (+{len(QUERY_ROWS)})')
     print(f'   - Expected pool size: ~{len(new_conversations) + 8} memories')
     print(f'   - Expected filtering: 100 candidates → ~30 candidates (70% reduction)')
 
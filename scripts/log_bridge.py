@@ -23,7 +23,13 @@ import threading
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -97,6 +103,33 @@ class LRUCache:
 # Global cache for deduplication
 seen_messages = LRUCache()
 
+# JSONL line decoder (orjson when available; its JSONDecodeError subclasses json's)
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _load_json_line(line: Union[str, bytes]):
+    """
+    Decode a single JSONL record
+
+    Raw bytes are decoded directly; lines with invalid UTF-8 are retried
+    with replacement characters so they are not dropped.
+
+    Args:
+        line: JSON line (str or bytes)
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON
+    """
+    try:
+        return _loads(line)
+    except ValueError:
+        if isinstance(line, bytes):
+            return _loads(line.decode('utf-8', errors='replace'))
+        raise
+
 
 class SessionTimeoutTracker:
     """
@@ -174,15 +207,50 @@ session_timeout_tracker: Optional[SessionTimeoutTracker] = None
 # Global session summary worker (initialized in main())
 session_summary_worker: Optional[SessionSummaryWorker] = None
 
+# Codex event_msg payload types that carry conversation turns -> role
+ROLLOUT_MESSAGE_ROLES: Dict[str, str] = {
+    "user_message": "user",
+    "agent_message": "assistant",
+}
+
+# Substrings every user_message/agent_message event_msg line must contain
+ROLLOUT_LINE_MARKERS: Tuple[str, ...] = ("event_msg", "_message")
+ROLLOUT_LINE_MARKERS_BYTES: Tuple[bytes, ...] = tuple(m.encode() for m in ROLLOUT_LINE_MARKERS)
 
-def parse_rollout_event(line: str, file_path: str) -> Optional[Tuple[str, str, str, float]]:
+ROLLOUT_SESSION_ID_PATTERN = re.compile(r'rollout-[^-]+-[^-]+-[^-]+-([^.]+)\.jsonl$')
+
+
+@lru_cache(maxsize=1024)
+def _rollout_session_id(file_path: str) -> Optional[str]:
+    """
+    Extract the session ID from a rollout file name
+
+    Format: rollout-2025-11-08T19-51-59-019a6318-2a47-7692-889d-f99b4fc182e3.jsonl
+
+    Args:
+        file_path: Full path to rollout file
+
+    Returns:
+        Session ID or None if the name does not match
+    """
+    match = ROLLOUT_SESSION_ID_PATTERN.search(file_path)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=1024)
+def _claude_session_id(file_path: str) -> str:
+    """Extract the session ID from a Claude project log name ({sessionId}.jsonl)"""
+    return Path(file_path).stem
+
+
+def parse_rollout_event(line: Union[str, bytes], file_path: str) -> Optional[Tuple[str, str, str, float]]:
     """
     Parse a rollout-*.jsonl event line
 
     Extracts user_message and agent_message events from Codex rollout logs.
 
     Args:
-        line: JSON line from rollout file
+        line: JSON line from rollout file (str or bytes)
         file_path: Full path to rollout file
 
     Returns:
@@ -192,8 +260,14 @@ def parse_rollout_event(line: str, file_path: str) -> Optional[Tuple[str, str, s
         >>> parse_rollout_event('{"type":"event_msg","payload":{"type":"user_message",...}}', "rollout-...-abc123.jsonl")
         ('abc123', 'user', 'hello', 1762599152.0)
     """
+    # Fast path: most rollout lines (response_item, turn_context, token_count)
+    # can be rejected by substring before paying for a JSON decode
+    markers = ROLLOUT_LINE_MARKERS_BYTES if isinstance(line, bytes) else ROLLOUT_LINE_MARKERS
+    if not all(marker in line for marker in markers):
+        return None
+
     try:
-        obj = json.loads(line)
+        obj = _load_json_line(line)
     except json.JSONDecodeError:
         return None
 
@@ -202,29 +276,21 @@ def parse_rollout_event(line: str, file_path: str) -> Optional[Tuple[str, str, s
         return None
 
     payload = obj.get("payload", {})
-    payload_type = payload.get("type")
 
-    # Extract session_id from filename
-    # Format: rollout-2025-11-08T19-51-59-019a6318-2a47-7692-889d-f99b4fc182e3.jsonl
-    match = re.search(r'rollout-[^-]+-[^-]+-[^-]+-([^.]+)\.jsonl$', file_path)
-    session_id = match.group(1) if match else None
+    # Map user_message/agent_message to a role; skip other event types
+    # (agent_reasoning, token_count, etc.) before touching the filename
+    role = ROLLOUT_MESSAGE_ROLES.get(payload.get("type"))
+    if role is None:
+        return None
+
+    # Extract session_id from filename (cached per file)
+    session_id = _rollout_session_id(file_path)
 
     if not session_id:
         logger.warning(f"Could not extract session_id from filename: {file_path}")
         return None
 
-    # Parse user_message
-    if payload_type == "user_message":
-        role = "user"
-        text = payload.get("message", "")
-    # Parse agent_message (assistant)
-    elif payload_type == "agent_message":
-        role = "assistant"
-        text = payload.get("message", "")
-    else:
-        # Skip other event types (agent_reasoning, token_count, etc.)
-        return None
-
+    text = payload.get("message", "")
     if not text.strip():
         return None
 
@@ -239,14 +305,14 @@ def parse_rollout_event(line: str, file_path: str) -> Optional[Tuple[str, str, s
     return (session_id, role, text, ts)
 
 
-def parse_claude_project_event(line: str, file_path: str) -> Optional[Tuple[str, str, str, float]]:
+def parse_claude_project_event(line: Union[str, bytes], file_path: str) -> Optional[Tuple[str, str, str, float]]:
     """
     Parse a Claude project log event line
 
     Extracts user/assistant messages from Claude project logs.
 
     Args:
-        line: JSON line from Claude project log
+        line: JSON line from Claude project log (str or bytes)
         file_path: Full path to project log file
 
     Returns:
@@ -257,26 +323,28 @@ def parse_claude_project_event(line: str, file_path: str) -> Optional[Tuple[str,
         ('abc123', 'user', 'hi', 1762599152.0)
     """
     try:
-        obj = json.loads(line)
+        obj = _load_json_line(line)
     except json.JSONDecodeError:
         return None
 
-    # Extract session_id from filename: {sessionId}.jsonl
-    session_id = Path(file_path).stem
+    # Extract session_id from filename: {sessionId}.jsonl (cached per file)
+    session_id = _claude_session_id(file_path)
 
     if not session_id:
         logger.warning(f"Could not extract session_id from filename: {file_path}")
         return None
 
+    # Message body is shared by both branches; look it up once per line
+    msg = obj.get("message") or {}
+
     # Parse user message
     if obj.get("type") == "user":
         role = "user"
-        msg = obj.get("message", {})
         text = msg.get("content", "")
     # Parse assistant message
-    elif "message" in obj and obj.get("message", {}).get("role") == "assistant":
+    elif msg.get("role") == "assistant":
         role = "assistant"
-        content = obj.get("message", {}).get("content", [])
+        content = msg.get("content", [])
         # content is array of {"type": "text", "text": "..."}
         if isinstance(content, list):
             text = "\n".join(c.get("text", "") for c in content if isinstance(c, dict) and c.get("type") == "text")
@@ -375,11 +443,12 @@ def tail_file(file_path: str, session_manager, parser_func):
 
     while True:
         try:
-            if not os.path.exists(file_path):
+            try:
+                size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 logger.info(f"File deleted or moved: {file_path}")
                 break
 
-            size = os.path.getsize(file_path)
             if size < last_size:
                 # File rotated or truncated
                 logger.info(f"File rotation detected: {file_path}")
@@ -387,33 +456,27 @@ def tail_file(file_path: str, session_manager, parser_func):
 
             last_size = size
 
-            # Open file with error handling for encoding issues
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                f.seek(offset)
-
-                # Read line by line to avoid splitting multibyte characters
-                while True:
-                    line = f.readline()
-                    if not line:
-                        # End of file reached
-                        offset = f.tell()
-                        break
-
-                    line = line.strip()
-                    if not line:
-                        offset = f.tell()
-                        continue
-
-                    result = parser_func(line, file_path)
-                    if result:
-                        sid, role, text, ts = result
-                        send_to_session_manager(session_manager, sid, role, text)
-
-                    offset = f.tell()
-
-        except UnicodeDecodeError as e:
-            logger.error(f"Unicode decode error in {file_path}: {e}")
-            # Skip to next check cycle
+            # Idle polls cost one stat; the file is only opened when it grew.
+            # The handle is closed again before sleeping: a held handle would
+            # block deleting/renaming the log on Windows and pin one fd per
+            # tailed file. Binary reads keep offset tracking cheap (no
+            # text-mode tell()) and hand raw bytes straight to the JSON decoder
+            if size > offset:
+                with open(file_path, 'rb', buffering=1 << 20) as f:
+                    f.seek(offset)
+
+                    for raw_line in f:
+                        offset += len(raw_line)
+
+                        line = raw_line.strip()
+                        if not line:
+                            continue
+
+                        result = parser_func(line, file_path)
+                        if result:
+                            sid, role, text, ts = result
+                            send_to_session_manager(session_manager, sid, role, text)
+
         except Exception as e:
             logger.error(f"Error reading {file_path}: {e}", exc_info=True)
 
@@ -430,6 +493,33 @@ def tail_claude_project_file(file_path: str, session_manager):
     tail_file(file_path, session_manager, parse_claude_project_event)
 
 
+def iter_rollout_files(root: str) -> Iterator[str]:
+    """
+    Recursively yield rollout-*.jsonl paths under root
+
+    Walks the tree with os.scandir and filters on the entry name, so no
+    Path objects or extra stat calls are made for non-matching entries.
+    Directories that vanish or cannot be read mid-walk are skipped.
+
+    Args:
+        root: Directory to walk (e.g. ~/.codex/sessions)
+
+    Yields:
+        Full path of each rollout file as a string
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.startswith("rollout-") and entry.name.endswith(".jsonl"):
+                        yield entry.path
+        except OSError:
+            continue
+
+
 def watch_rollout_directory(session_manager):
     """
     Watch for new rollout-*.jsonl files and start tailing them
@@ -453,7 +543,7 @@ def watch_rollout_directory(session_manager):
     while True:
         try:
             # Scan for rollout-*.jsonl files
-            current_files = set(sessions_dir.rglob("rollout-*.jsonl"))
+            current_files = set(iter_rollout_files(str(sessions_dir)))
 
             # Start monitoring new files
             new_files = current_files - active_files
@@ -464,9 +554,9 @@ def watch_rollout_directory(session_manager):
                 # Start tail thread
                 t = threading.Thread(
                     target=tail_rollout_file,
-                    args=(str(f), session_manager),
+                    args=(f, session_manager),
                     daemon=True,
-                    name=f"tail-{f.name}"
+                    name=f"tail-{os.path.basename(f)}"
                 )
                 t.start()
 
@@ -3,7 +3,9 @@
 """Replay a list of MCP JSON-RPC requests and record the responses."""
 
 import argparse
+import contextlib
 import csv
+import io
 import json
 import math
 import os
@@ -204,9 +206,16 @@ def replay(request_specs, output_dir, rpc_timeout=15):
         for entry in results:
             fp.write(json.dumps(entry) + "\n")
     print(f"Saved run log to {out_path}")
-    if metrics:
-        print_metrics_summary(metrics)
-    print_reranker_metrics(reranker_metrics)
+
+    # Echo the summary and keep a copy next to the run log for
+    # create_precision_baseline
+    summary = io.StringIO()
+    with contextlib.redirect_stdout(summary):
+        if metrics:
+            print_metrics_summary(metrics)
+        print_reranker_metrics(reranker_metrics)
+    print(summary.getvalue(), end="")
+    out_path.with_suffix(".summary.txt").write_text(summary.getvalue(), encoding="utf-8")
     return out_path, metrics, results, reranker_metrics
 
 
@@ -8,8 +8,10 @@ Loads configuration from YAML file and provides typed Config object.
 Requirements: Requirement 13 (Configuration Management)
 """
 
+import copy
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 from typing import Optional, Dict, Any, List
@@ -42,6 +44,7 @@ class SearchConfig:
     cross_encoder_top_k: int = 3
     cross_encoder_cache_size: int = 128
     cross_encoder_cache_ttl_seconds: int = 900
+    cross_encoder_cache_max_ttl_seconds: int = 0
     cross_encoder_max_parallel: int = 3
     cross_encoder_fallback_max_wait_ms: int = 500
     cross_encoder_fallback_mode: str = "heuristic"
@@ -219,10 +222,12 @@ def load_config(config_path: Optional[str] = None) -> Config:
         logger.warning("Config file not found, using defaults")
         return Config()
 
-    # Load YAML
+    # Load YAML (memoized per file version; copied so callers can't mutate the cache)
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+        stat = config_file.stat()
+        yaml_data = copy.deepcopy(
+            _read_yaml_cached(str(config_file), stat.st_mtime_ns, stat.st_size)
+        )
 
         if not yaml_data:
             logger.warning("Config file is empty, using defaults")
@@ -241,6 +246,23 @@ def load_config(config_path: Optional[str] = None) -> Config:
         raise ValueError(f"Failed to load config: {e}")
 
 
+@lru_cache(maxsize=8)
+def _read_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Read and parse a YAML file, memoized by path and file version
+
+    Args:
+        path: YAML file path
+        mtime_ns: File modification time (part of the cache key)
+        size: File size in bytes (part of the cache key)
+
+    Returns:
+        Parsed YAML data
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
 def _parse_config(data: Dict[str, Any]) -> Config:
     """
     Parse config data from YAML
@@ -296,6 +318,10 @@ def _parse_config(data: Dict[str, Any]) -> Config:
                 'cross_encoder_cache_ttl_seconds',
                 SearchConfig.cross_encoder_cache_ttl_seconds
             ),
+            cross_encoder_cache_max_ttl_seconds=search_data.get(
+                'cross_encoder_cache_max_ttl_seconds',
+                SearchConfig.cross_encoder_cache_max_ttl_seconds
+            ),
             cross_encoder_max_parallel=search_data.get(
                 'cross_encoder_max_parallel',
                 SearchConfig.cross_encoder_max_parallel
@@ -448,6 +474,7 @@ def save_config(config: Config, config_path: Optional[str] = None) -> None:
             'cross_encoder_top_k': config.search.cross_encoder_top_k,
             'cross_encoder_cache_size': config.search.cross_encoder_cache_size,
             'cross_encoder_cache_ttl_seconds': config.search.cross_encoder_cache_ttl_seconds,
+            'cross_encoder_cache_max_ttl_seconds': config.search.cross_encoder_cache_max_ttl_seconds,
             'cross_encoder_max_parallel': config.search.cross_encoder_max_parallel,
             'vector_candidate_count': config.search.vector_candidate_count,
             'bm25_candidate_count': config.search.bm25_candidate_count,
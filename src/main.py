@@ -286,7 +286,10 @@ def init_services(
             enabled=True,
             cache_max_entries=config.search.cross_encoder_cache_size,
             cache_ttl_seconds=config.search.cross_encoder_cache_ttl_seconds,
-            max_parallel_reranks=config.search.cross_encoder_max_parallel
+            cache_max_ttl_seconds=config.search.cross_encoder_cache_max_ttl_seconds,
+            max_parallel_reranks=config.search.cross_encoder_max_parallel,
+            fallback_max_wait_ms=config.search.cross_encoder_fallback_max_wait_ms,
+            fallback_mode=config.search.cross_encoder_fallback_mode
         )
 
     search_service = SearchService(
@@ -156,6 +156,67 @@ class LocalLLMClient:
             logger.error(f"Embedding generation failed: {e}")
             raise OllamaConnectionError(f"Failed to generate embedding: {e}") from e
 
+    def generate_embeddings(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        keep_alive: str = "10m"
+    ) -> List[List[float]]:
+        """
+        Generate embedding vectors for several texts in one request
+
+        Uses Ollama's batch /api/embed endpoint and asks it to keep the model
+        loaded. Falls back to one generate_embedding call per text when the
+        server doesn't support batch input (older Ollama builds).
+
+        Args:
+            texts: Input texts
+            model: Embedding model name (default: self.embedding_model)
+            keep_alive: How long Ollama keeps the model resident afterwards
+
+        Returns:
+            Embedding vectors, in the same order as texts
+
+        Raises:
+            OllamaConnectionError: If Ollama is unreachable
+            ModelNotFoundError: If model is not available
+
+        Example:
+            >>> client = LocalLLMClient()
+            >>> embeddings = client.generate_embeddings(["Hello", "World"])
+            >>> len(embeddings)
+            2
+        """
+        if not texts:
+            return []
+
+        # Use instance's embedding model if not specified
+        if model is None:
+            model = self.embedding_model
+
+        try:
+            response = requests.post(
+                f"{self.ollama_url}/api/embed",
+                json={"model": model, "input": list(texts), "keep_alive": keep_alive},
+                timeout=60,
+            )
+            embeddings: List[List[float]] = []
+            if response.status_code != 404:
+                response.raise_for_status()
+                embeddings = response.json().get("embeddings") or []
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Batch embedding generation failed: {e}")
+            raise OllamaConnectionError(f"Failed to generate embeddings: {e}") from e
+
+        if len(embeddings) != len(texts) or not all(embeddings):
+            # 404 (no /api/embed or unknown model) or a partial answer:
+            # embed one by one, which also reports a missing model properly
+            logger.debug("Batch embedding unavailable; embedding texts one by one.")
+            return [self.generate_embedding(text, model=model) for text in texts]
+
+        logger.debug(f"Generated {len(embeddings)} embeddings in one batch")
+        return embeddings
+
     def generate(
         self,
         prompt: str,
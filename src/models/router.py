@@ -186,6 +186,26 @@ class ModelRouter:
         """
         return self.route(task_type='embedding', text=text)
 
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one local batch call
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Embedding vectors, in the same order as texts
+
+        Example:
+            >>> router = ModelRouter(local_client, cli_client)
+            >>> embeddings = router.generate_embeddings(["Hello", "World"])
+        """
+        logger.debug(f"Generating {len(texts)} embeddings in one batch")
+        return self.local_llm_client.generate_embeddings(
+            texts=texts,
+            model=self.embedding_model
+        )
+
     def classify_schema(self, content: str) -> str:
         """
         Classify memory schema (convenience method)
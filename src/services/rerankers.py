@@ -13,6 +13,7 @@ from __future__ import annotations
 
 from typing import List, Dict, Any, Optional, Tuple
 import logging
+import math
 import time
 from time import perf_counter
 from collections import OrderedDict
@@ -25,6 +26,15 @@ from src.utils.vector_utils import cosine_similarity
 
 logger = logging.getLogger(__name__)
 
+# Opening -> closing quote characters recognised for literal (exact-phrase) queries
+LITERAL_QUOTE_PAIRS: Dict[str, str] = {
+    '"': '"',
+    "'": "'",
+    "“": "”",
+    "「": "」",
+    "『": "』",
+}
+
 
 class CrossEncoderReranker:
     """LLM-backed reranker that assigns a 0-1 relevance score per candidate."""
@@ -36,23 +46,30 @@ class CrossEncoderReranker:
         enabled: bool = True,
         cache_max_entries: int = 128,
         cache_ttl_seconds: int = 900,
+        cache_max_ttl_seconds: int = 0,
         log_interval: int = 50,
         max_parallel_reranks: int = 1,
         fallback_max_wait_ms: int = 0,
         fallback_mode: str = "heuristic",
         semantic_similarity_threshold: float = 0.80,  # Phase 4: Lowered from 0.85 to improve L3 hit rate
         skip_rerank_for_simple_queries: bool = True,  # Phase 4: Skip cross-encoder for low-complexity queries
-        simple_query_max_words: int = 3  # Phase 4: Queries with ≤N words are considered simple
+        simple_query_max_words: int = 3,  # Phase 4: Queries with ≤N words are considered simple
+        skip_rerank_for_literal_queries: bool = True  # Skip cross-encoder for quoted exact-phrase queries
     ):
         self.model_router = model_router
         self.max_candidates = max_candidates
         self.enabled = enabled
         self.skip_rerank_for_simple_queries = skip_rerank_for_simple_queries
         self.simple_query_max_words = simple_query_max_words
+        self.skip_rerank_for_literal_queries = skip_rerank_for_literal_queries
         self.cache_max_entries = max(0, cache_max_entries)
         self.cache_ttl_seconds = max(0, cache_ttl_seconds)
+        # TLRU: L1 entries hit repeatedly live up to cache_max_ttl_seconds
+        # (disabled unless it exceeds the base TTL)
+        self.cache_max_ttl_seconds = max(self.cache_ttl_seconds, cache_max_ttl_seconds)
         self.semantic_similarity_threshold = max(0.0, min(1.0, semantic_similarity_threshold))
         self._cache: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._cache_hit_counts: Dict[str, int] = {}
         self._keyword_cache: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
         # L3: Semantic cache - stores (embedding, score, timestamp) per candidate_id
         self._semantic_cache: "Dict[str, List[Tuple[List[float], float, float]]]" = {}
@@ -89,7 +106,8 @@ class CrossEncoderReranker:
         self,
         query: str,
         candidates: List[Dict[str, Any]],
-        prefetch: bool = False
+        prefetch: bool = False,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         if not self.enabled or not candidates or not query:
             return candidates
@@ -103,13 +121,22 @@ class CrossEncoderReranker:
             )
             return candidates
 
+        # Exact-phrase lookups: the cross-encoder cannot beat a literal match
+        if self.skip_rerank_for_literal_queries and self._is_literal_query(query):
+            logger.debug(
+                "[SKIP_RERANK] Quoted literal query detected, skipping cross-encoder: '%s'",
+                query[:50]
+            )
+            return candidates
+
         top_slice = candidates[: self.max_candidates]
         rescored: List[Dict[str, Any]] = []
 
-        # Generate query embedding once for semantic cache (L3)
-        # Only generate if cache is enabled
-        query_embedding: Optional[List[float]] = None
-        if self.cache_max_entries > 0 and self.cache_ttl_seconds > 0:
+        # Generate query embedding once for semantic cache (L3), reusing the
+        # caller's embedding when provided. Only needed if cache is enabled
+        if not (self.cache_max_entries > 0 and self.cache_ttl_seconds > 0):
+            query_embedding = None
+        elif query_embedding is None:
             try:
                 query_embedding = self.model_router.generate_embedding(query)
             except Exception as exc:  # pragma: no cover
@@ -140,15 +167,19 @@ class CrossEncoderReranker:
                 futures.append((future, entry))
 
             for future, entry in futures:
-                score, wait_ms = future.result()
+                try:
+                    score, wait_ms = future.result()
+                except Exception as exc:
+                    # One failed worker must not sink the whole rerank
+                    logger.warning(f"Cross-encoder worker failed, using fallback score: {exc}")
+                    enriched = entry.copy()
+                    enriched['cross_score'] = self._fallback_score(entry)
+                    rescored.append(enriched)
+                    continue
                 self._stats['queue_wait_total_ms'] += wait_ms
                 if wait_ms > self._stats['queue_wait_max_ms']:
                     self._stats['queue_wait_max_ms'] = wait_ms
-                if (
-                    self.fallback_max_wait_ms
-                    and wait_ms > self.fallback_max_wait_ms
-                    and self.fallback_mode != "none"
-                ):
+                if score is None:
                     self._stats['queue_rejections'] += 1
                     fallback_score = self._fallback_score(entry)
                     enriched = entry.copy()
@@ -168,8 +199,9 @@ class CrossEncoderReranker:
         query: str,
         candidate: Dict[str, Any],
         query_embedding: Optional[List[float]],
-        prefetch: bool = False
-    ) -> float:
+        prefetch: bool = False,
+        allow_llm: bool = True
+    ) -> Optional[float]:
         cache_key = self._build_cache_key(query, candidate)
         keyword_cache_key = self._build_keyword_cache_key(query, candidate)
         candidate_id = self._extract_candidate_id(candidate)
@@ -180,21 +212,24 @@ class CrossEncoderReranker:
             and cache_key is not None
         )
 
-        # L1: Exact match cache
-        if cache_enabled:
+        # L1: Exact match cache (cache_enabled implies a key; restated for type narrowing)
+        if cache_enabled and cache_key is not None:
             cached = self._cache.get(cache_key)
             if cached:
                 score, cached_at = cached
-                if now - cached_at <= self.cache_ttl_seconds:
+                if now - cached_at <= self._l1_ttl(cache_key):
                     self._stats['pairs_scored'] += 1
                     self._stats['cache_hits'] += 1
                     if prefetch:
                         self._stats['prefetch_cache_hits'] += 1
                     self._cache.move_to_end(cache_key)
+                    if self.cache_max_ttl_seconds > self.cache_ttl_seconds:
+                        self._cache_hit_counts[cache_key] = self._cache_hit_counts.get(cache_key, 0) + 1
                     self._maybe_log_cache_stats()
                     return score
                 else:
                     self._cache.pop(cache_key, None)
+                    self._cache_hit_counts.pop(cache_key, None)
             self._stats['cache_misses'] += 1
             if prefetch:
                 self._stats['prefetch_cache_misses'] += 1
@@ -209,9 +244,7 @@ class CrossEncoderReranker:
                     self._stats['keyword_cache_hits'] += 1
                     self._keyword_cache.move_to_end(keyword_cache_key)
                     # Also store in L1 for faster future access
-                    self._cache[cache_key] = (score, now)
-                    if len(self._cache) > self.cache_max_entries:
-                        self._cache.popitem(last=False)
+                    self._store_l1(cache_key, score, now)
                     self._maybe_log_cache_stats()
                     return score
                 else:
@@ -255,9 +288,7 @@ class CrossEncoderReranker:
                             self._stats['semantic_cache_hits'] += 1
 
                             # Store in L1 and L2 for faster future access
-                            self._cache[cache_key] = (estimated_score, now)
-                            if len(self._cache) > self.cache_max_entries:
-                                self._cache.popitem(last=False)
+                            self._store_l1(cache_key, estimated_score, now)
                             if keyword_cache_key:
                                 self._keyword_cache[keyword_cache_key] = (estimated_score, now)
                                 if len(self._keyword_cache) > self.cache_max_entries:
@@ -290,6 +321,10 @@ class CrossEncoderReranker:
                 logger.debug("[DEBUG] L3 candidate not in semantic cache: %s", candidate_id)
             self._stats['semantic_cache_misses'] += 1
 
+        if not allow_llm:
+            # Cache-only lookup (pair waited past the fallback budget)
+            return None
+
         # LLM: Call cross-encoder
         score, _, _ = self._score_pair(query, candidate.get('content', ''))
         self._stats['pairs_scored'] += 1
@@ -297,9 +332,7 @@ class CrossEncoderReranker:
         # Store in L1, L2, and L3 caches
         if cache_enabled:
             # L1: Exact match
-            self._cache[cache_key] = (score, now)
-            if len(self._cache) > self.cache_max_entries:
-                self._cache.popitem(last=False)
+            self._store_l1(cache_key, score, now)
 
             # L2: Keyword match
             if keyword_cache_key:
@@ -327,6 +360,32 @@ class CrossEncoderReranker:
         self._maybe_log_cache_stats()
         return score
 
+    def _store_l1(self, cache_key: Optional[str], score: float, now: float) -> None:
+        """Insert a score into the L1 cache, evicting the least recently used entry."""
+        if cache_key is None:
+            return
+        self._cache[cache_key] = (score, now)
+        if len(self._cache) > self.cache_max_entries:
+            evicted_key, _ = self._cache.popitem(last=False)
+            self._cache_hit_counts.pop(evicted_key, None)
+
+    def _l1_ttl(self, cache_key: Optional[str]) -> float:
+        """
+        TTL for an L1 entry, stretched by how often the entry has been hit.
+
+        Follows time-aware LRU: ttl = base * (1 + log2(1 + hits)), capped at
+        cache_max_ttl_seconds. Returns the base TTL when adaptive TTL is disabled.
+        """
+        if cache_key is None:
+            return self.cache_ttl_seconds
+        hits = self._cache_hit_counts.get(cache_key, 0)
+        if not hits:
+            return self.cache_ttl_seconds
+        return min(
+            self.cache_max_ttl_seconds,
+            self.cache_ttl_seconds * (1 + math.log2(1 + hits))
+        )
+
     def _score_pair(self, query: str, candidate_text: str) -> Tuple[float, float, bool]:
         if not candidate_text:
             return 0.0, 0.0, False
@@ -373,11 +432,26 @@ class CrossEncoderReranker:
         query_embedding: Optional[List[float]],
         enqueued_at: float,
         prefetch: bool = False
-    ) -> Tuple[float, float]:
+    ) -> Tuple[Optional[float], float]:
         wait_ms = (perf_counter() - enqueued_at) * 1000
+        if self._exceeds_fallback_wait(wait_ms):
+            # Past the budget a cached score is still free, but a miss returns
+            # None so the caller substitutes the fallback instead of an LLM call
+            score = self._score_with_cache(
+                query, candidate, query_embedding, prefetch=prefetch, allow_llm=False
+            )
+            return score, wait_ms
         score = self._score_with_cache(query, candidate, query_embedding, prefetch=prefetch)
         return score, wait_ms
 
+    def _exceeds_fallback_wait(self, wait_ms: float) -> bool:
+        """Whether a queued pair waited past the fallback budget."""
+        return bool(
+            self.fallback_max_wait_ms
+            and wait_ms > self.fallback_max_wait_ms
+            and self.fallback_mode != "none"
+        )
+
     def _fallback_score(self, candidate: Dict[str, Any]) -> float:
         """
         Return a heuristic score when reranker fallback is triggered.
@@ -495,6 +569,7 @@ class CrossEncoderReranker:
             'semantic_cache_embeddings': semantic_cache_embeddings,
             'cache_size': self.cache_max_entries,
             'cache_ttl_seconds': self.cache_ttl_seconds,
+            'cache_max_ttl_seconds': self.cache_max_ttl_seconds,
             'semantic_similarity_threshold': self.semantic_similarity_threshold,
             'cache_hits': self._stats['cache_hits'],
             'cache_misses': self._stats['cache_misses'],
@@ -531,6 +606,17 @@ class CrossEncoderReranker:
             'max_parallel_reranks': self.max_parallel_reranks,
         }
 
+    def reset_metrics(self) -> None:
+        """
+        Zero the scoring/cache counters while keeping cached scores.
+
+        Lets benchmarks warm the caches first and then measure steady state.
+        """
+        self._stats = {
+            key: 0.0 if isinstance(value, float) else 0
+            for key, value in self._stats.items()
+        }
+
     def warm_semantic_cache_from_pool(
         self,
         embeddings: Dict[str, List[float]]
@@ -622,3 +708,28 @@ class CrossEncoderReranker:
 
         # Simple if ≤ max_words threshold
         return word_count <= self.simple_query_max_words
+
+    def _is_literal_query(self, query: str) -> bool:
+        """
+        Determine if query is a quoted exact-phrase lookup.
+
+        A query wrapped entirely in a matching pair of quotes (e.g. "LRU cache TTL",
+        「検索レイテンシ」) asks for a literal match that BM25/vector retrieval already
+        ranks; running the LLM reranker on it only adds latency.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            True if the whole query is a single quoted phrase, False otherwise
+        """
+        stripped = query.strip()
+        if len(stripped) < 3:
+            return False
+
+        closing = LITERAL_QUOTE_PAIRS.get(stripped[0])
+        if closing is None or stripped[-1] != closing:
+            return False
+
+        # Reject '"a" and "b"' style queries that merely start and end with quotes
+        return closing not in stripped[1:-1]
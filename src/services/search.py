@@ -124,6 +124,7 @@ class SearchService:
         filters: Optional[Dict[str, Any]] = None,
         prefetch: bool = False,
         include_session_summaries: bool = True,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search memories using hybrid search
@@ -134,6 +135,7 @@ class SearchService:
             filters: Optional metadata filters (e.g., {'schema_type': 'Incident'})
             prefetch: Whether this is a prefetch operation (affects logging)
             include_session_summaries: Whether to include session summaries (default: True)
+            query_embedding: Precomputed embedding for query (skips the embedding call)
 
         Returns:
             List of search result dicts, sorted by relevance:
@@ -162,9 +164,10 @@ class SearchService:
             log_fn(f"Searching for: '{query[:100]}...' (top_k={result_limit}, prefetch={prefetch})")
             start_time = datetime.now()
 
-            # Step 1: Generate query embedding
-            query_embedding = self._generate_query_embedding(query)
-            logger.debug("Generated query embedding")
+            # Step 1: Generate query embedding (unless the caller supplied one)
+            if query_embedding is None:
+                query_embedding = self._generate_query_embedding(query)
+                logger.debug("Generated query embedding")
 
             # Step 2 & 3: Vector search (embedding) + BM25 search in parallel
             with ThreadPoolExecutor(max_workers=2) as executor:
@@ -200,7 +203,8 @@ class SearchService:
             final_results = self._apply_cross_encoder_rerank(
                 query,
                 final_results,
-                prefetch=prefetch
+                prefetch=prefetch,
+                query_embedding=query_embedding
             )
 
             # Calculate search time
@@ -406,7 +410,8 @@ class SearchService:
         self,
         query: str,
         results: List[Dict[str, Any]],
-        prefetch: bool = False
+        prefetch: bool = False,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         if not self.cross_encoder_reranker or not results:
             return results
@@ -415,7 +420,8 @@ class SearchService:
             reranked = self.cross_encoder_reranker.rerank(
                 query,
                 prioritized,
-                prefetch=prefetch
+                prefetch=prefetch,
+                query_embedding=query_embedding
             )
             return reranked if reranked else results
         except Exception as exc:
@@ -13,6 +13,7 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import pickle
 import logging
+import numpy as np  # always available: rank_bm25 depends on it
 from rank_bm25 import BM25Okapi
 
 logger = logging.getLogger(__name__)
@@ -132,25 +133,19 @@ class BM25Index:
             scores = self.index.get_scores(tokenized_query)
 
             # Get top-k results
-            # Sort by score (descending) and take top_k
-            scored_docs = [
-                (i, scores[i]) for i in range(len(scores)) if scores[i] != 0
-            ]
+            top_indices = self._top_indices(scores, top_k)
 
-            if not scored_docs:
+            if not top_indices:
                 logger.debug("BM25 search found 0 results (all scores zero)")
                 return []
 
-            scored_docs.sort(key=lambda item: item[1], reverse=True)
-            top_scored = scored_docs[:top_k]
-
             # Build results
             results = []
-            for i, score in top_scored:
+            for i in top_indices:
                 doc_id = self.doc_ids[i]
                 results.append({
                     'id': doc_id,
-                    'score': float(score),
+                    'score': float(scores[i]),
                     'content': self.documents[doc_id]
                 })
 
@@ -161,6 +156,26 @@ class BM25Index:
             logger.error(f"BM25 search failed: {e}")
             return []
 
+    @staticmethod
+    def _top_indices(scores: Any, top_k: int) -> List[int]:
+        """
+        Indices of the top_k non-zero scores, highest first
+
+        Ties keep document order. Sorts on the numpy array instead of
+        building and sorting (index, score) tuples in Python.
+
+        Args:
+            scores: Per-document BM25 scores
+            top_k: Number of indices to return
+
+        Returns:
+            Document indices ordered by descending score
+        """
+        scores = np.asarray(scores)
+        candidates = np.flatnonzero(scores)
+        order = np.argsort(-scores[candidates], kind='stable')
+        return [int(i) for i in candidates[order[:top_k]]]
+
     def delete(self, doc_id: str) -> None:
         """
         Delete a document from the index
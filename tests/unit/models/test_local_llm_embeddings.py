@@ -29,13 +29,14 @@ def test_embeddings_retry_with_prompt(monkeypatch):
         # /api/tags check
         return _Resp(200, {"models": []})
 
-    def fake_post(url, json=None, timeout=0):
-        calls.append(json)
+    def fake_post(url, timeout=0, **kwargs):
+        json_payload = kwargs["json"]
+        calls.append(json_payload)
         # First call with 'input' returns empty embedding
-        if "input" in json:
+        if "input" in json_payload:
             return _Resp(200, {"embedding": []})
         # Retry with 'prompt' returns a vector
-        if "prompt" in json:
+        if "prompt" in json_payload:
             return _Resp(200, {"embedding": [0.1, 0.2, 0.3]})
         return _Resp(400, {})
 
@@ -52,3 +53,55 @@ def test_embeddings_retry_with_prompt(monkeypatch):
     assert calls[0].get("input") == "hello"
     assert calls[1].get("prompt") == "hello"
 
+
+
+def test_batch_embeddings_use_single_embed_call(monkeypatch):
+    from src.models.local_llm import LocalLLMClient
+
+    calls = []
+
+    def fake_get(url, timeout):
+        return _Resp(200, {"models": []})
+
+    def fake_post(url, timeout=0, **kwargs):
+        calls.append((url, kwargs["json"]))
+        return _Resp(200, {"embeddings": [[0.1, 0.2], [0.3, 0.4]]})
+
+    import src.models.local_llm as mod
+
+    monkeypatch.setattr(mod.requests, "get", fake_get)
+    monkeypatch.setattr(mod.requests, "post", fake_post)
+
+    client = LocalLLMClient(ollama_url="http://localhost:11434")
+    vecs = client.generate_embeddings(["hello", "world"])
+
+    assert vecs == [[0.1, 0.2], [0.3, 0.4]]
+    assert len(calls) == 1
+    assert calls[0][0].endswith("/api/embed")
+    assert calls[0][1]["input"] == ["hello", "world"]
+
+
+def test_batch_embeddings_fall_back_when_embed_endpoint_missing(monkeypatch):
+    from src.models.local_llm import LocalLLMClient
+
+    calls = []
+
+    def fake_get(url, timeout):
+        return _Resp(200, {"models": []})
+
+    def fake_post(url, timeout=0, **kwargs):
+        calls.append(url)
+        if url.endswith("/api/embed"):
+            return _Resp(404, {})
+        return _Resp(200, {"embedding": [float(len(kwargs["json"]["input"]))]})
+
+    import src.models.local_llm as mod
+
+    monkeypatch.setattr(mod.requests, "get", fake_get)
+    monkeypatch.setattr(mod.requests, "post", fake_post)
+
+    client = LocalLLMClient(ollama_url="http://localhost:11434")
+    vecs = client.generate_embeddings(["hi", "hello"])
+
+    assert vecs == [[2.0], [5.0]]
+    assert calls.count("http://localhost:11434/api/embeddings") == 2
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import io
+import json
+from unittest.mock import MagicMock
+
+from scripts import concurrent_test
+from src.config import Config
+from src.services.rerankers import CrossEncoderReranker
+from src.services.search import SearchService
+
+
+def test_initialize_services_builds_search_stack_from_config(monkeypatch, tmp_path):
+    for name in ("ChromaVectorDB", "BM25Index", "LocalLLMClient", "CLILLMClient"):
+        monkeypatch.setattr(concurrent_test, name, MagicMock(name=name))
+
+    config = Config(data_dir=str(tmp_path))
+    config.search.cross_encoder_max_parallel = 4
+    config.search.cross_encoder_fallback_max_wait_ms = 250
+    config.search.cross_encoder_cache_max_ttl_seconds = 3600
+
+    search_service, reranker = concurrent_test.initialize_services(config)
+
+    assert isinstance(search_service, SearchService)
+    assert isinstance(reranker, CrossEncoderReranker)
+    assert search_service.cross_encoder_reranker is reranker
+    assert reranker.max_parallel_reranks == 4
+    assert reranker.fallback_max_wait_ms == 250
+    assert reranker.cache_max_ttl_seconds == 3600
+    concurrent_test.BM25Index.assert_called_once_with(
+        persist_path=str(tmp_path / "bm25_index.pkl")
+    )
+
+
+def test_run_concurrent_test_streams_records_after_warmup():
+    search_service = MagicMock()
+    search_service.model_router.generate_embeddings.side_effect = (
+        lambda texts: [[float(i)] for i in range(len(texts))]
+    )
+    search_service.search.return_value = [{"id": "m1"}]
+    reranker = MagicMock()
+    reranker.get_metrics.return_value = {"total_cache_hit_rate": 50.0}
+    stream = io.StringIO()
+
+    results = asyncio.run(concurrent_test.run_concurrent_test(
+        search_service=search_service,
+        reranker=reranker,
+        concurrency=2,
+        num_rounds=3,
+        results_stream=stream,
+    ))
+
+    query_count = len(concurrent_test.get_test_queries())
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(records) == 6
+    assert all(record["success"] for record in records)
+    assert search_service.search.call_count == query_count + 6
+    assert all(
+        call.kwargs["query_embedding"] is not None
+        for call in search_service.search.call_args_list
+    )
+    reranker.reset_metrics.assert_called_once()
+    assert results["query_results"]["successful"] == 6
+    assert "detailed_results" not in results
+    assert results["overall_passed"] is True
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+import json
+
+import pytest
+
+from scripts.create_precision_baseline import (
+    create_baseline,
+    extract_metrics_from_run,
+    parse_summary_output,
+)
+
+
+def test_extract_metrics_counts_search_memory_requests(tmp_path: Path):
+    run_file = tmp_path / "mcp_run-20250101-000000.jsonl"
+    lines = [
+        json.dumps({"request": {"method": "start_session"}, "response": {}}),
+        json.dumps({
+            "request": {"method": "search_memory", "params": {"query": "a"}},
+            "response": {"result": {"count": 0}},
+        }),
+        json.dumps({
+            "request": {"method": "search_memory", "params": {"query": "b"}},
+            "response": {"result": {"count": 3}},
+        }),
+        json.dumps({
+            "request": {"method": "get_memory", "params": {"query": "search_memory"}},
+            "response": {"result": {"count": 0}},
+        }),
+        '{"request": {"method": "search_memory"',  # truncated line
+        "Macro Precision: 0.886, Macro NDCG: 1.470",
+    ]
+    run_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    metrics = extract_metrics_from_run(run_file)
+
+    assert metrics["total_queries"] == 2
+    assert metrics["zero_hit_queries"] == 1
+
+
+def test_extract_metrics_accepts_indented_json_lines(tmp_path: Path):
+    run_file = tmp_path / "mcp_run-indented.jsonl"
+    entry = json.dumps({
+        "request": {"method": "search_memory", "params": {"query": "a"}},
+        "response": {"result": {"count": 0}},
+    })
+    run_file.write_text(f"  {entry}\n\t{entry}\n", encoding="utf-8")
+
+    metrics = extract_metrics_from_run(run_file)
+
+    assert metrics["total_queries"] == 2
+    assert metrics["zero_hit_queries"] == 2
+
+
+def test_extract_metrics_handles_empty_run_file(tmp_path: Path):
+    run_file = tmp_path / "mcp_run-empty.jsonl"
+    run_file.write_bytes(b"")
+
+    metrics = extract_metrics_from_run(run_file)
+
+    assert metrics["total_queries"] == 0
+    assert metrics["zero_hit_queries"] == 0
+
+
+def test_parse_summary_output_reads_replay_summary():
+    stdout = "\n".join([
+        "Req q1: P@5=1.00, NDCG@5=1.00, relevant=5",
+        "--------------------------",
+        "Macro Precision: 0.886, Macro NDCG: 1.470",
+        "",
+        "Reranker Metrics",
+        "====================",
+        "Cache hit rate:       0.21",
+        "Cache size / entries: 128 / 40",
+        "Pairs scored:         86",
+        "Prefetch requests:    10 (hits 7, misses 20)",
+        "LLM calls/failures:   67 / 0",
+        "Avg LLM latency (ms): 812.4",
+    ])
+
+    assert parse_summary_output(stdout) == {
+        "macro_precision": 0.886,
+        "macro_ndcg": 1.470,
+        "cache_hit_rate": 0.21,
+        "pairs_scored": 86,
+        "prefetch_hits": 7,
+        "prefetch_misses": 20,
+        "llm_calls": 67,
+    }
+
+
+def test_create_baseline_reads_summary_next_to_run(tmp_path: Path):
+    run_file = tmp_path / "mcp_run-20250101-000000.jsonl"
+    run_file.write_text(
+        json.dumps({
+            "request": {"method": "search_memory"},
+            "response": {"result": {"count": 2}},
+        }) + "\n",
+        encoding="utf-8",
+    )
+    run_file.with_suffix(".summary.txt").write_text(
+        "Macro Precision: 0.912, Macro NDCG: 1.300\n"
+        "Cache hit rate:       0.40\n"
+        "LLM calls/failures:   12 / 1\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "baseline.json"
+
+    create_baseline(output, run_file=run_file)
+
+    metrics = json.loads(output.read_text(encoding="utf-8"))["metrics"]
+    assert metrics["macro_precision"] == 0.912
+    assert metrics["cache_hit_rate"] == 0.40
+    assert metrics["llm_calls"] == 12
+    assert metrics["total_queries"] == 1
+
+
+def test_create_baseline_requires_summary(tmp_path: Path):
+    run_file = tmp_path / "mcp_run-20250101-000000.jsonl"
+    run_file.write_text("", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        create_baseline(tmp_path / "baseline.json", run_file=run_file)
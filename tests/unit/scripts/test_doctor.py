@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import threading
+import types
+
+from scripts.doctor import HealthCheck
+
+
+def test_run_all_checks_runs_concurrently_and_reports_in_order(monkeypatch, capsys):
+    checker = HealthCheck()
+    names = [
+        "check_ollama_running",
+        "check_ollama_models",
+        "check_data_directory",
+        "check_chroma_db",
+        "check_config_file",
+    ]
+    # Every check waits for all the others, so a serial run would time out
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def _make_check(name):
+        def _check():
+            barrier.wait()
+            return name != "check_chroma_db", f"{name} done", ["fix it"]
+        return _check
+
+    for name in names:
+        monkeypatch.setattr(checker, name, _make_check(name))
+
+    assert checker.run_all_checks() is False
+    assert (checker.passed, checker.failed) == (4, 1)
+
+    out = capsys.readouterr().out
+    positions = [out.index(f"{name} done") for name in names]
+    assert positions == sorted(positions)
+
+
+def test_ollama_checks_share_one_tags_request(monkeypatch):
+    import requests
+
+    import scripts.doctor as doctor
+
+    calls = []
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        raise requests.exceptions.ConnectionError("refused")
+
+    monkeypatch.setattr(doctor, "_port_open", lambda url: True)
+    monkeypatch.setattr(doctor, "_get_session", lambda: types.SimpleNamespace(get=fake_get))
+
+    checker = HealthCheck()
+    running = checker.check_ollama_running()
+    models = checker.check_ollama_models()
+
+    assert running[:2] == (False, "Ollama is not running")
+    assert models[0] is False
+    assert len(calls) == 1
+
+
+def test_filesystem_checks_stat_each_path_once(monkeypatch, tmp_path):
+    import os
+
+    import scripts.doctor as doctor
+
+    checker = HealthCheck()
+    checker.config = None
+    monkeypatch.setattr(doctor.Path, "home", lambda: tmp_path)
+    (tmp_path / ".context-orchestrator").mkdir()
+
+    stats = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        stats.append(str(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(doctor.os, "stat", counting_stat)
+
+    for _ in range(2):
+        assert checker.check_data_directory()[0] is True
+        assert checker.check_chroma_db()[0] is True
+        assert checker.check_config_file()[0] is False
+
+    assert len(stats) == len(set(stats))
+
+
+def test_port_open_tries_ipv6_loopback_for_localhost(monkeypatch):
+    import scripts.doctor as doctor
+
+    attempts = []
+
+    def fake_create_connection(address, timeout):
+        attempts.append(address)
+        if address[0] != "::1":
+            raise ConnectionRefusedError(address)
+
+        class _Conn:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        return _Conn()
+
+    monkeypatch.setattr(doctor.socket, "create_connection", fake_create_connection)
+
+    assert doctor._port_open("http://localhost:11434") is True
+    assert attempts == [("127.0.0.1", 11434), ("::1", 11434)]
+
+    attempts.clear()
+    assert doctor._port_open("http://gpu-box:11434") is False
+    assert attempts == [("gpu-box", 11434)]
+
+
+class _TagsResponse:
+    status_code = 200
+
+    def __init__(self, names):
+        import json
+
+        self.content = json.dumps({"models": [{"name": name} for name in names]}).encode()
+
+
+def test_ollama_models_reports_missing_models(monkeypatch):
+    import scripts.doctor as doctor
+
+    monkeypatch.setattr(doctor, "_port_open", lambda url: True)
+    tags = _TagsResponse(["nomic-embed-text:latest", "llama3:8b"])
+    monkeypatch.setattr(
+        doctor, "_get_session", lambda: types.SimpleNamespace(get=lambda url, timeout: tags)
+    )
+    checker = HealthCheck()
+    checker.config = None
+
+    success, message, remediation = checker.check_ollama_models()
+
+    assert success is False
+    assert message == "Missing models: qwen2.5:7b"
+    assert remediation == ["Install missing model: ollama pull qwen2.5:7b"]
+
+
+def test_chroma_check_rejects_file_in_place_of_directory(monkeypatch, tmp_path):
+    import scripts.doctor as doctor
+
+    monkeypatch.setattr(doctor.Path, "home", lambda: tmp_path)
+    data_dir = tmp_path / ".context-orchestrator"
+    data_dir.mkdir()
+    (data_dir / "chroma_db").write_text("not a db", encoding="utf-8")
+
+    checker = HealthCheck()
+    checker.config = None
+    success, message, _ = checker.check_chroma_db()
+
+    assert success is False
+    assert "not a directory" in message
+
+
+def test_successful_checks_are_reused_across_runs(monkeypatch, tmp_path):
+    cache_path = tmp_path / ".doctor-cache.json"
+    calls = {"ok": 0, "bad": 0}
+
+    def ok_check():
+        calls["ok"] += 1
+        return True, "fine", []
+
+    def bad_check():
+        calls["bad"] += 1
+        return False, "broken", ["fix it"]
+
+    for fresh in (False, False, True):
+        checker = HealthCheck(cache_ttl=30, cache_path=cache_path, fresh=fresh)
+        first = checker._cached_check("ok", ok_check)
+        checker._cached_check("bad", bad_check)
+        checker._save_check_cache()
+
+    # Second run reused the success; failures and --fresh always re-run
+    assert calls == {"ok": 2, "bad": 3}
+    assert first == (True, "fine", [])
+
+    reused = HealthCheck(cache_ttl=30, cache_path=cache_path)._cached_check("ok", ok_check)
+    assert reused == (True, "fine (cached)", [])
+
+
+def test_chroma_check_accepts_sqlite_header_without_chromadb(monkeypatch, tmp_path):
+    import sys
+
+    import scripts.doctor as doctor
+
+    monkeypatch.setattr(doctor.Path, "home", lambda: tmp_path)
+    chroma_dir = tmp_path / ".context-orchestrator" / "chroma_db"
+    chroma_dir.mkdir(parents=True)
+    (chroma_dir / "chroma.sqlite3").write_bytes(b"SQLite format 3\x00" + b"\x00" * 84)
+    # Any chromadb import would fail loudly
+    monkeypatch.setitem(sys.modules, "chromadb", None)
+
+    checker = HealthCheck()
+    checker.config = None
+    success, message, _ = checker.check_chroma_db()
+    assert success is True
+    assert "sqlite" in message
+
+    deep_checker = HealthCheck(deep=True)
+    deep_checker.config = None
+    assert deep_checker.check_chroma_db()[0] is False
+
+
+def test_closed_ollama_port_fails_without_http_request(monkeypatch):
+    import scripts.doctor as doctor
+
+    probed = []
+
+    def fake_port_open(url):
+        probed.append(url)
+        return False
+
+    def fail_get(url, timeout):
+        raise AssertionError("HTTP request sent to a closed port")
+
+    monkeypatch.setattr(doctor, "_port_open", fake_port_open)
+    monkeypatch.setattr(doctor, "_get_session", lambda: types.SimpleNamespace(get=fail_get))
+
+    checker = HealthCheck()
+    checker.config = None
+
+    assert checker.check_ollama_running()[:2] == (False, "Ollama is not running")
+    assert probed == ["http://localhost:11434"]
+
+
+def test_config_check_treats_file_in_place_of_config_dir_as_missing(monkeypatch, tmp_path):
+    import scripts.doctor as doctor
+
+    monkeypatch.setattr(doctor.Path, "home", lambda: tmp_path)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".context-orchestrator").write_text("not a directory", encoding="utf-8")
+
+    checker = HealthCheck()
+    success, message, _ = checker.check_config_file()
+
+    assert success is False
+    assert message == "Config file not found (using defaults)"
+
+
+def test_cached_check_is_not_reused_when_inputs_change(tmp_path):
+    cache_path = tmp_path / ".doctor-cache.json"
+    calls = []
+
+    def models_check():
+        calls.append(1)
+        return True, "models ok", []
+
+    first = HealthCheck(cache_ttl=30, cache_path=cache_path)
+    first._cached_check("Ollama Models", models_check, ["http://localhost:11434", "a", "b"])
+    first._save_check_cache()
+
+    same = HealthCheck(cache_ttl=30, cache_path=cache_path)
+    reused = same._cached_check("Ollama Models", models_check, ["http://localhost:11434", "a", "b"])
+    changed = HealthCheck(cache_ttl=30, cache_path=cache_path)
+    rerun = changed._cached_check("Ollama Models", models_check, ["http://localhost:11434", "a", "c"])
+
+    assert reused == (True, "models ok (cached)", [])
+    assert rerun == (True, "models ok", [])
+    assert len(calls) == 2
+
+
+def test_check_cache_lives_in_configured_data_dir(monkeypatch, tmp_path):
+    import scripts.doctor as doctor
+    from src.config import Config
+
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(doctor, "load_config", lambda: Config(data_dir=str(data_dir)))
+
+    checker = HealthCheck(cache_ttl=30)
+
+    assert checker.cache_path == data_dir / ".doctor-cache.json"
+    assert checker._check_inputs()["Data Directory"] == [str(data_dir)]
+
+
+def test_ollama_checks_fail_cleanly_without_requests(monkeypatch):
+    import scripts.doctor as doctor
+
+    monkeypatch.setattr(doctor, "_port_open", lambda url: True)
+    monkeypatch.setattr(doctor, "_SESSION", None)
+    monkeypatch.setitem(sys.modules, "requests", None)
+
+    checker = HealthCheck()
+    checker.config = None
+
+    running = checker.check_ollama_running()
+    models = checker.check_ollama_models()
+
+    assert running[0] is False and running[1].startswith("Cannot check Ollama:")
+    assert models[0] is False and models[1].startswith("Cannot check models:")
+    assert running[2] == doctor.MISSING_REQUESTS_REMEDIATION
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+from scripts.expand_appbrain_scenarios import _splice_conversations
+
+
+def _dump(data):
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def test_splice_matches_full_rewrite():
+    existing = {
+        'projects': [{'name': 'OrchestratorX', 'tags': ['app_dev']}],
+        'conversations': [{'user': 'こんにちは', 'refs': ['a']}],
+    }
+    new = [{'user': 'How?', 'refs': ['b'], 'metadata': {'topic': 't'}}]
+
+    spliced, total = _splice_conversations(_dump(existing), new)
+
+    expected = dict(existing, conversations=existing['conversations'] + new)
+    assert spliced == _dump(expected)
+    assert total == 2
+
+
+def test_splice_into_empty_conversations():
+    existing = {'projects': [], 'conversations': []}
+    new = [{'user': 'q'}]
+
+    spliced, total = _splice_conversations(_dump(existing), new)
+
+    assert json.loads(spliced) == {'projects': [], 'conversations': new}
+    assert total == 1
+
+
+def test_splice_returns_none_for_unexpected_layout():
+    raw = _dump({'conversations': [], 'projects': []})
+
+    assert _splice_conversations(raw, [{'user': 'q'}]) is None
+
+
+def test_splice_counts_only_top_level_conversations():
+    existing = {
+        'projects': [{'name': 'p1'}, {'name': 'p2'}],
+        'conversations': [
+            {'user': 'a', 'metadata': {'nested': [{'deep': True}]}},
+            {'user': 'b'},
+            {'user': 'c'},
+        ],
+    }
+
+    _, total = _splice_conversations(_dump(existing), [{'user': 'd'}])
+
+    assert total == 4
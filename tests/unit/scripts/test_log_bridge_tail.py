@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+import time
+import types
+
+import scripts.log_bridge as log_bridge
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_tail_file_holds_no_handle_between_polls(monkeypatch, tmp_path):
+    log_file = tmp_path / "session.jsonl"
+    log_file.write_bytes(b'{"n": 1}\n')
+
+    real_sleep = time.sleep
+    monkeypatch.setattr(
+        log_bridge, "time", types.SimpleNamespace(time=time.time, sleep=lambda _: real_sleep(0.01))
+    )
+
+    handles = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        handles.append(handle)
+        return handle
+
+    monkeypatch.setattr(log_bridge, "open", tracking_open, raising=False)
+
+    sent = []
+    monkeypatch.setattr(
+        log_bridge, "send_to_session_manager", lambda manager, sid, role, text: sent.append(text)
+    )
+
+    def parser(line, file_path):
+        return "sid", "user", line.decode(), 0.0
+
+    tail = threading.Thread(
+        target=log_bridge.tail_file, args=(str(log_file), None, parser), daemon=True
+    )
+    tail.start()
+
+    assert _wait_for(lambda: sent == ['{"n": 1}'])
+    with real_open(log_file, "ab") as f:
+        f.write(b'{"n": 2}\n')
+    assert _wait_for(lambda: len(sent) == 2)
+
+    # Idle polls neither reopen the file nor keep it open
+    opened = len(handles)
+    real_sleep(0.1)
+    assert len(handles) == opened
+    assert all(handle.closed for handle in handles)
+
+    # The log can be renamed away while tailed; the tail then stops
+    os.replace(log_file, tmp_path / "session.jsonl.1")
+    tail.join(timeout=5)
+    assert not tail.is_alive()
+    assert sent == ['{"n": 1}', '{"n": 2}']
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import threading
+import time
+
 from src.services.rerankers import CrossEncoderReranker
 
 
@@ -134,3 +137,172 @@ def test_prefetch_stats_accumulate_and_hit_cache():
     assert metrics["prefetch_requests"] == 2
     assert metrics["prefetch_cache_hits"] >= 1
     assert metrics["prefetch_cache_misses"] >= 1
+
+
+def _patch_queue_clock(monkeypatch, wait_seconds: float):
+    """Make every queued pair appear to have waited wait_seconds before starting."""
+    def _fake_perf_counter():
+        # Enqueue times are taken on the calling thread, start times on workers
+        return 0.0 if threading.current_thread() is threading.main_thread() else wait_seconds
+
+    monkeypatch.setattr("src.services.rerankers.perf_counter", _fake_perf_counter)
+
+
+def test_parallel_rerank_skips_llm_for_pairs_past_wait_budget(monkeypatch):
+    router = _Router(result="0.9")
+    reranker = CrossEncoderReranker(
+        model_router=router,
+        max_candidates=4,
+        cache_max_entries=0,
+        cache_ttl_seconds=0,
+        max_parallel_reranks=2,
+        fallback_max_wait_ms=10,
+        skip_rerank_for_simple_queries=False,
+    )
+    _patch_queue_clock(monkeypatch, wait_seconds=1.0)
+
+    results = reranker.rerank("parallel rerank under queue pressure", _candidates(4))
+
+    assert router.calls == 0
+    assert len(results) == 4
+    assert reranker.get_metrics()["queue_rejections"] == 4
+
+
+def test_parallel_rerank_serves_cached_score_past_wait_budget(monkeypatch):
+    router = _Router(result="0.9")
+    reranker = CrossEncoderReranker(
+        model_router=router,
+        max_candidates=2,
+        max_parallel_reranks=2,
+        fallback_max_wait_ms=10,
+        skip_rerank_for_simple_queries=False,
+    )
+    query = "parallel rerank with a warm cache entry"
+    candidates = _candidates(2)
+    reranker._store_l1(reranker._build_cache_key(query, candidates[0]), 0.7, time.time())
+    _patch_queue_clock(monkeypatch, wait_seconds=1.0)
+
+    results = reranker.rerank(query, candidates, query_embedding=[0.1] * 768)
+
+    scores = {item["id"]: item["cross_score"] for item in results}
+    assert scores["mem-0"] == 0.7
+    assert scores["mem-1"] == 0.0  # heuristic fallback with no components
+    assert router.calls == 0
+    assert reranker.get_metrics()["queue_rejections"] == 1
+
+
+def test_parallel_rerank_falls_back_when_worker_raises():
+    router = _Router(result="0.8")
+    reranker = CrossEncoderReranker(
+        model_router=router,
+        max_candidates=2,
+        cache_max_entries=0,
+        cache_ttl_seconds=0,
+        max_parallel_reranks=2,
+        skip_rerank_for_simple_queries=False,
+    )
+    candidates = _candidates(2)
+    original = reranker._score_with_cache
+
+    def _flaky(query, candidate, query_embedding, prefetch=False):
+        if candidate["id"] == "mem-1":
+            raise RuntimeError("worker crashed")
+        return original(query, candidate, query_embedding, prefetch=prefetch)
+
+    reranker._score_with_cache = _flaky
+
+    results = reranker.rerank("parallel rerank with a failing worker", candidates)
+
+    scores = {item["id"]: item["cross_score"] for item in results}
+    assert scores["mem-0"] == 0.8
+    assert scores["mem-1"] == 0.0  # heuristic fallback with no components
+
+
+def test_quoted_literal_query_skips_rerank():
+    router = _Router(result="0.9")
+    reranker = CrossEncoderReranker(
+        model_router=router,
+        max_candidates=2,
+        cache_max_entries=0,
+        cache_ttl_seconds=0,
+        skip_rerank_for_simple_queries=False,
+    )
+    candidates = _candidates(2)
+
+    for query in ('"LRU cache TTL configuration"', "「プロジェクトメモリプールの設計」"):
+        assert reranker.rerank(query, candidates) is candidates
+    assert router.calls == 0
+
+    # Several quoted phrases are not a single literal lookup
+    reranker.rerank('"cache" versus "queue" tradeoffs', candidates)
+    assert router.calls == 2
+
+
+def test_provided_query_embedding_skips_embedding_call():
+    router = _Router(result="0.7")
+    reranker = CrossEncoderReranker(
+        model_router=router,
+        max_candidates=1,
+        cache_max_entries=16,
+        cache_ttl_seconds=60,
+        skip_rerank_for_simple_queries=False,
+    )
+
+    reranker.rerank(
+        "Need deployment checklist for production release",
+        _candidates(),
+        query_embedding=[0.2] * 768,
+    )
+    assert router.embedding_calls == 0
+    assert router.calls == 1
+
+
+def test_frequently_hit_scores_get_longer_ttl(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("src.services.rerankers.time.time", lambda: clock["now"])
+    query = "Need deployment checklist for production release"
+
+    def _llm_calls(max_ttl: int) -> int:
+        router = _Router(result="0.6")
+        reranker = CrossEncoderReranker(
+            model_router=router,
+            max_candidates=1,
+            cache_max_entries=16,
+            cache_ttl_seconds=10,
+            cache_max_ttl_seconds=max_ttl,
+            skip_rerank_for_simple_queries=False,
+        )
+        for offset in (0, 5, 15):
+            clock["now"] = 1000.0 + offset
+            reranker.rerank(query, _candidates())
+        return router.calls
+
+    # Fixed TTL: the entry expires before the third lookup
+    assert _llm_calls(max_ttl=0) == 2
+    # Adaptive TTL: one hit stretches the TTL to 20s, so the third lookup hits
+    assert _llm_calls(max_ttl=60) == 1
+
+
+def test_reset_metrics_keeps_cached_scores():
+    router = _Router(result="0.9")
+    reranker = CrossEncoderReranker(
+        model_router=router,
+        max_candidates=1,
+        cache_max_entries=16,
+        cache_ttl_seconds=60,
+        skip_rerank_for_simple_queries=False,
+    )
+    query = "Need deployment checklist for production release"
+
+    reranker.rerank(query, _candidates())
+    reranker.reset_metrics()
+
+    metrics = reranker.get_metrics()
+    assert metrics["pairs_scored"] == 0
+    assert metrics["llm_calls"] == 0
+    assert metrics["cache_entries"] == 1
+
+    reranker.rerank(query, _candidates())
+    metrics = reranker.get_metrics()
+    assert metrics["cache_hits"] == 1
+    assert metrics["llm_calls"] == 0
@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from src.storage.bm25_index import BM25Index
+
+
+SCORES = [0.0, 1.5, 0.2, 1.5, 0.0, 3.0, 0.2]
+
+
+def test_top_indices_orders_by_score_and_keeps_tie_order():
+    assert BM25Index._top_indices(SCORES, 4) == [5, 1, 3, 2]
+    assert BM25Index._top_indices(SCORES, 10) == [5, 1, 3, 2, 6]
+    assert BM25Index._top_indices([0.0, 0.0], 3) == []
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+
+import yaml
+
+import src.config as config_module
+from src.config import load_config
+
+
+def _count_yaml_parses(monkeypatch):
+    calls = []
+    real_safe_load = yaml.safe_load
+
+    def _counting_safe_load(stream):
+        calls.append(stream)
+        return real_safe_load(stream)
+
+    config_module._read_yaml_cached.cache_clear()
+    monkeypatch.setattr(config_module.yaml, "safe_load", _counting_safe_load)
+    return calls
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    parses = _count_yaml_parses(monkeypatch)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "search:\n  project_prefetch_queries:\n    - project status\n",
+        encoding="utf-8",
+    )
+
+    first = load_config(str(config_file))
+    first.search.project_prefetch_queries.append("mutated")
+
+    # Second load is served from the cache and unaffected by caller mutations
+    second = load_config(str(config_file))
+    assert second.search.project_prefetch_queries == ["project status"]
+    assert len(parses) == 1
+
+    config_file.write_text(
+        "search:\n  project_prefetch_queries:\n    - open issues\n    - risk summary\n",
+        encoding="utf-8",
+    )
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = load_config(str(config_file))
+    assert third.search.project_prefetch_queries == ["open issues", "risk summary"]
+    assert len(parses) == 2
+
+
+def test_load_config_reparses_when_only_size_changes(tmp_path, monkeypatch):
+    parses = _count_yaml_parses(monkeypatch)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("search:\n  result_count: 5\n", encoding="utf-8")
+    original = config_file.stat()
+
+    assert load_config(str(config_file)).search.result_count == 5
+
+    # Same mtime (e.g. coarse filesystem timestamps), different size
+    config_file.write_text("search:\n  result_count: 12\n", encoding="utf-8")
+    os.utime(config_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+    assert load_config(str(config_file)).search.result_count == 12
+    assert len(parses) == 2